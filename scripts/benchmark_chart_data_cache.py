@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the size and load time of chart data cache entries stored as pickled
+dataframes and as Arrow IPC streams.
+
+    python scripts/benchmark_chart_data_cache.py --rows 100000 --columns 50
+"""
+import pickle
+import time
+from typing import Any, Callable, Dict, Optional
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils.arrow import arrow_ipc_to_df, df_to_arrow_ipc
+
+
+def generate_df(rows: int, columns: int) -> pd.DataFrame:
+    """
+    Generate a wide dataframe similar to a chart result, cycling through a
+    timestamp, a string dimension, an integer and a float metric.
+    """
+    rng = np.random.default_rng(42)
+    data: Dict[str, Any] = {}
+    for i in range(columns):
+        kind = i % 4
+        if kind == 0:
+            data[f"ts_{i}"] = pd.date_range("2020-01-01", periods=rows, freq="min")
+        elif kind == 1:
+            data[f"dim_{i}"] = rng.choice(["US", "FR", "BR", "IN", None], rows)
+        elif kind == 2:
+            data[f"count_{i}"] = rng.integers(0, 1_000_000, rows)
+        else:
+            data[f"sum_{i}"] = rng.random(rows) * 1000
+    return pd.DataFrame(data)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows.")
+@click.option("--columns", default=20, help="Number of columns.")
+@click.option("--repeat", default=5, help="Number of runs, the best is reported.")
+def main(rows: int, columns: int, repeat: int) -> None:
+    df = generate_df(rows, columns)
+    print(f"Dataframe: {rows} rows x {columns} columns\n")
+    print(f"{'format':<14}{'size (MB)':>12}{'dump (ms)':>12}{'load (ms)':>12}")
+
+    # the cache backend pickles the whole value, so the Arrow payload is pickled too
+    pickled = pickle.dumps({"df": df}, pickle.HIGHEST_PROTOCOL)
+    dump = measure(lambda: pickle.dumps({"df": df}, pickle.HIGHEST_PROTOCOL), repeat)
+    load = measure(lambda: pickle.loads(pickled)["df"], repeat)
+    print(f"{'pickle':<14}{len(pickled) / 2**20:>12.2f}{dump * 1000:>12.1f}", end="")
+    print(f"{load * 1000:>12.1f}")
+
+    compression: Optional[str]
+    for compression in (None, "lz4", "zstd"):
+
+        def dumps(codec: Optional[str] = compression) -> bytes:
+            payload = df_to_arrow_ipc(df, codec)
+            return pickle.dumps({"df": payload}, pickle.HIGHEST_PROTOCOL)
+
+        pickled = dumps()
+        dump = measure(dumps, repeat)
+        load = measure(lambda: arrow_ipc_to_df(pickle.loads(pickled)["df"]), repeat)
+        label = f"arrow/{compression or 'none'}"
+        print(f"{label:<14}{len(pickled) / 2**20:>12.2f}{dump * 1000:>12.1f}", end="")
+        print(f"{load * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
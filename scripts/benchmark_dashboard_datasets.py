@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Count the SQL statements sent to the metadata database, and measure the time it
+takes, to build the dataset payloads of a dashboard.
+
+The dashboard, its charts and its datasets are created in a transaction that is
+rolled back at the end.
+
+    python scripts/benchmark_dashboard_datasets.py --charts 40 --datasets 15
+"""
+import json
+import time
+from typing import Any, List
+
+import click
+from sqlalchemy import event
+
+
+@click.command()
+@click.option("--charts", default=40, help="Number of charts.")
+@click.option("--datasets", default=15, help="Number of datasets.")
+@click.option("--columns", default=50, help="Number of columns per dataset.")
+@click.option("--metrics", default=10, help="Number of metrics per dataset.")
+@click.option("--loads", default=3, help="Number of dashboard loads.")
+def main(  # pylint: disable=too-many-locals
+    charts: int, datasets: int, columns: int, metrics: int, loads: int
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset import db
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    database = Database(database_name="benchmark", sqlalchemy_uri="sqlite://")
+    tables: List[SqlaTable] = []
+    for i in range(datasets):
+        table = SqlaTable(table_name=f"benchmark_{i}", database=database)
+        for j in range(columns):
+            TableColumn(column_name=f"col_{j}", type="VARCHAR", table=table)
+        for j in range(metrics):
+            SqlMetric(metric_name=f"metric_{j}", expression="COUNT(*)", table=table)
+        tables.append(table)
+    db.session.add_all(tables)
+    db.session.flush()
+
+    slices = [
+        Slice(
+            slice_name=f"benchmark_{i}",
+            viz_type="table",
+            datasource_type="table",
+            datasource_id=tables[i % datasets].id,
+            params=json.dumps(
+                {
+                    "metrics": ["metric_0", "metric_1"],
+                    "groupby": ["col_0", "col_1"],
+                    "adhoc_filters": [],
+                }
+            ),
+        )
+        for i in range(charts)
+    ]
+    dashboard = Dashboard(dashboard_title="benchmark", slices=slices)
+    db.session.add(dashboard)
+    db.session.flush()
+    dashboard_id = dashboard.id
+
+    statements: List[str] = []
+
+    def count(*args: Any) -> None:
+        statements.append(args[2])
+
+    print(f"Dashboard: {charts} charts over {datasets} datasets\n")
+    event.listen(db.session.connection(), "before_cursor_execute", count)
+    try:
+        for i in range(loads):
+            # start from an empty session, as a new request would
+            db.session.expunge_all()
+            statements.clear()
+            start = time.perf_counter()
+            dashboard = db.session.query(Dashboard).get(dashboard_id)
+            dashboard.datasets_trimmed_for_slices()
+            duration = time.perf_counter() - start
+            print(
+                f"Load {i + 1}: {len(statements)} statements, {duration * 1000:.0f} ms"
+            )
+    finally:
+        event.remove(db.session.connection(), "before_cursor_execute", count)
+        db.session.rollback()
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how long it takes to build a ``SupersetResultSet`` (and its dataframe) from
+DB-API rows of mixed types.
+
+    python scripts/benchmark_result_set.py --rows 1000000 --columns 20
+"""
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, List, Tuple
+
+import click
+
+START = datetime(2020, 1, 1)
+
+
+def generate_value(kind: int, row: int) -> Any:
+    if row % 97 == 0:
+        return None
+    if kind == 0:
+        return row
+    if kind == 1:
+        return row * 1.5
+    if kind == 2:
+        return f"value-{row % 1000}"
+    if kind == 3:
+        return START + timedelta(minutes=row)
+    if kind == 4:
+        return row % 2 == 0
+    if kind == 5:
+        return Decimal(row) / 100
+    # nested values are stringified
+    return {"id": row}
+
+
+def generate_rows(rows: int, columns: int) -> List[Tuple[Any, ...]]:
+    return [
+        tuple(generate_value(column % 7, row) for column in range(columns))
+        for row in range(rows)
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows.")
+@click.option("--columns", default=20, help="Number of columns.")
+@click.option("--repeat", default=3, help="Number of runs, the best is reported.")
+def main(rows: int, columns: int, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = generate_rows(rows, columns)
+    description = [
+        (f"col_{i}", None, None, None, None, None, None) for i in range(columns)
+    ]
+    print(f"Rows: {rows} x {columns} columns of mixed types\n")
+
+    def from_rows() -> "SupersetResultSet":
+        return SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    duration = measure(from_rows, repeat)
+    print(f"SupersetResultSet from rows: {duration:.2f} s")
+
+    table = from_rows().pa_table
+    duration = measure(
+        lambda: SupersetResultSet(table, description, BaseEngineSpec),  # type: ignore
+        repeat,
+    )
+    print(f"SupersetResultSet from an Arrow table: {duration:.2f} s")
+
+    result_set = from_rows()
+    duration = measure(result_set.to_pandas_df, repeat)
+    print(f"SupersetResultSet.to_pandas_df: {duration:.2f} s")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how long it takes to build and compile the predicate that filters series
+limited queries to the top groups of their prequery, on databases that don't
+support joins.
+
+    python scripts/benchmark_top_groups.py --dimensions 3
+"""
+import time
+from typing import Any, Callable, Dict, List, TYPE_CHECKING
+
+import click
+import pandas as pd
+from sqlalchemy import and_, column, or_
+from sqlalchemy.sql import ColumnElement
+
+if TYPE_CHECKING:
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+SERIES_LIMITS = (10, 100, 1000)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def get_or_chain(
+    table: "SqlaTable",
+    df: pd.DataFrame,
+    dimensions: List[str],
+    groupby_exprs: Dict[str, Any],
+    columns_by_name: Dict[str, "TableColumn"],
+) -> ColumnElement:
+    """The predicate built with one equality per dimension and row, as a baseline"""
+    # pylint: disable=protected-access
+    return or_(
+        *[
+            and_(
+                *[
+                    groupby_exprs[dimension]
+                    == table._normalize_prequery_result_type(
+                        row, dimension, columns_by_name
+                    )
+                    for dimension in dimensions
+                ]
+            )
+            for _, row in df.iterrows()
+        ]
+    )
+
+
+@click.command()
+@click.option("--dimensions", default=3, help="Number of dimensions.")
+@click.option("--repeat", default=3, help="Number of runs, the best is reported.")
+def main(dimensions: int, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    database = Database(database_name="benchmark", sqlalchemy_uri="sqlite://")
+    table = SqlaTable(table_name="benchmark", database=database)
+    names = [f"dim_{i}" for i in range(dimensions)]
+    columns_by_name = {
+        name: TableColumn(column_name=name, type="VARCHAR", table=table)
+        for name in names
+    }
+    groupby_exprs = {name: column(name) for name in names}
+
+    def compile_(predicate: ColumnElement) -> str:
+        return str(predicate.compile(compile_kwargs={"literal_binds": True}))
+
+    for series_limit in SERIES_LIMITS:
+        # most groups share their leading values, as in a real top N
+        df = pd.DataFrame(
+            {
+                name: [
+                    f"{name}-{row // 10 ** (dimensions - i - 1)}"
+                    for row in range(series_limit)
+                ]
+                for i, name in enumerate(names)
+            }
+        )
+        print(f"Series limit: {series_limit} x {dimensions} dimensions")
+
+        duration = measure(
+            lambda: compile_(  # pylint: disable=cell-var-from-loop
+                get_or_chain(table, df, names, groupby_exprs, columns_by_name)
+            ),
+            repeat,
+        )
+        print(f"  OR of ANDs: {duration * 1000:.1f} ms")
+
+        for allows_tuple_in in (False, True):
+            table.db_engine_spec.allows_tuple_in = allows_tuple_in
+            duration = measure(
+                lambda: compile_(  # pylint: disable=cell-var-from-loop
+                    table._get_top_groups(  # pylint: disable=protected-access
+                        df, names, groupby_exprs, columns_by_name
+                    )
+                ),
+                repeat,
+            )
+            label = "tuple IN" if allows_tuple_in else "factored IN"
+            print(f"  {label}: {duration * 1000:.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        main()  # pylint: disable=no-value-for-parameter
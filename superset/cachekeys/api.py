@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -28,6 +28,11 @@ from superset.cachekeys.schemas import CacheInvalidationRequestSchema
 from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import cache_manager, db, event_logger
 from superset.models.cache import CacheKey
+from superset.utils.cache import (
+    chart_cache_tag,
+    database_cache_tag,
+    invalidate_cache_tags,
+)
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -58,10 +63,13 @@ class CacheRestApi(BaseSupersetModelRestApi):
         post:
           description: >-
             Takes a list of datasources, finds the associated cache records and
-            invalidates them and removes the database records
+            invalidates them and removes the database records. When
+            CACHE_INVALIDATION_INDEX_ENABLED is set, the cached chart results of
+            the datasources, databases and charts are also purged.
           requestBody:
             description: >-
-              A list of datasources uuid or the tuples of database and datasource names
+              A list of datasources uuid or the tuples of database and datasource
+              names, and lists of database and chart ids
             required: true
             content:
               application/json:
@@ -93,6 +101,14 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        if current_app.config["CACHE_INVALIDATION_INDEX_ENABLED"]:
+            cache_tags = [
+                *datasource_uids,
+                *map(database_cache_tag, datasources.get("database_ids", [])),
+                *map(chart_cache_tag, datasources.get("chart_ids", [])),
+            ]
+            invalidate_cache_tags(cache_manager.data_cache, cache_tags)
+
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
@@ -51,3 +51,11 @@ class CacheInvalidationRequestSchema(Schema):
         fields.Nested(Datasource),
         description="A list of the data source and database names",
     )
+    database_ids = fields.List(
+        fields.Integer(),
+        description="A list of database ids, whose cached results are invalidated",
+    )
+    chart_ids = fields.List(
+        fields.Integer(),
+        description="A list of chart ids, whose cached results are invalidated",
+    )
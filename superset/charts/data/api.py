@@ -18,10 +18,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 
 import simplejson
-from flask import current_app, make_response, request, Response
+from flask import current_app, make_response, request, Response, stream_with_context
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -37,14 +37,17 @@ from superset.charts.data.commands.create_async_job_command import (
 )
 from superset.charts.data.commands.get_data_command import ChartDataCommand
 from superset.charts.data.query_context_cache_loader import QueryContextCacheLoader
-from superset.charts.post_processing import apply_post_process
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
-from superset.connectors.base.models import BaseDatasource
 from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.utils.async_query_manager import AsyncQueryTokenException
-from superset.utils.core import create_zip, get_user_id, json_int_dttm_ser
+from superset.utils.core import (
+    create_zip,
+    get_user_id,
+    json_int_dttm_ser,
+    stream_zip,
+)
 from superset.views.base import CsvResponse, generate_download_headers
 from superset.views.base_api import statsd_metrics
 
@@ -130,6 +133,12 @@ class ChartDataRestApi(ChartRestApi):
             "format", ChartDataResultFormat.JSON
         )
         json_body["result_type"] = request.args.get("type", ChartDataResultType.FULL)
+        if json_body["result_type"] == ChartDataResultType.POST_PROCESSED:
+            # the results are post-processed according to the saved chart
+            try:
+                json_body["form_data"] = json.loads(chart.params)
+            except (TypeError, json.decoder.JSONDecodeError):
+                json_body["form_data"] = {}
 
         try:
             query_context = self._create_query_context_from_form(json_body)
@@ -152,14 +161,7 @@ class ChartDataRestApi(ChartRestApi):
         ):
             return self._run_async(json_body, command)
 
-        try:
-            form_data = json.loads(chart.params)
-        except (TypeError, json.decoder.JSONDecodeError):
-            form_data = {}
-
-        return self._get_data_response(
-            command=command, form_data=form_data, datasource=query_context.datasource
-        )
+        return self._get_data_response(command)
 
     @expose("/data", methods=["POST"])
     @protect()
@@ -240,10 +242,7 @@ class ChartDataRestApi(ChartRestApi):
         ):
             return self._run_async(json_body, command)
 
-        form_data = json_body.get("form_data")
-        return self._get_data_response(
-            command, form_data=form_data, datasource=query_context.datasource
-        )
+        return self._get_data_response(command)
 
     @expose("/data/<cache_key>", methods=["GET"])
     @protect()
@@ -327,21 +326,9 @@ class ChartDataRestApi(ChartRestApi):
         result = async_command.run(form_data, get_user_id())
         return self.response(202, **result)
 
-    def _send_chart_response(
-        self,
-        result: Dict[Any, Any],
-        form_data: Optional[Dict[str, Any]] = None,
-        datasource: Optional[BaseDatasource] = None,
-    ) -> Response:
-        result_type = result["query_context"].result_type
+    def _send_chart_response(self, result: Dict[Any, Any]) -> Response:
         result_format = result["query_context"].result_format
 
-        # Post-process the data so it matches the data presented in the chart.
-        # This is needed for sending reports based on text charts that do the
-        # post-processing of data, eg, the pivot table.
-        if result_type == ChartDataResultType.POST_PROCESSED:
-            result = apply_post_process(result, form_data, datasource)
-
         if result_format == ChartDataResultFormat.CSV:
             # Verify user has permission to export CSV file
             if not security_manager.can_access("can_csv", "Superset"):
@@ -353,10 +340,27 @@ class ChartDataRestApi(ChartRestApi):
             if len(result["queries"]) == 1:
                 # return single query results csv format
                 data = result["queries"][0]["data"]
+                if not isinstance(data, str):
+                    # the CSV is streamed, chunk by chunk
+                    data = stream_with_context(data)
                 return CsvResponse(data, headers=generate_download_headers("csv"))
 
             # return multi-query csv results bundled as a zip file
             encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+            if not isinstance(result["queries"][0]["data"], str):
+                # the CSVs are streamed, and so is the zip file
+                streamed_files = (
+                    (
+                        f"query_{idx + 1}.csv",
+                        (chunk.encode(encoding) for chunk in query["data"]),
+                    )
+                    for idx, query in enumerate(result["queries"])
+                )
+                return Response(
+                    stream_with_context(stream_zip(streamed_files)),
+                    headers=generate_download_headers("zip"),
+                    mimetype="application/zip",
+                )
             files = {
                 f"query_{idx + 1}.csv": result["data"].encode(encoding)
                 for idx, result in enumerate(result["queries"])
@@ -383,8 +387,6 @@ class ChartDataRestApi(ChartRestApi):
         self,
         command: ChartDataCommand,
         force_cached: bool = False,
-        form_data: Optional[Dict[str, Any]] = None,
-        datasource: Optional[BaseDatasource] = None,
     ) -> Response:
         try:
             result = command.run(force_cached=force_cached)
@@ -393,7 +395,7 @@ class ChartDataRestApi(ChartRestApi):
         except ChartDataQueryFailedError as exc:
             return self.response_400(message=exc.message)
 
-        return self._send_chart_response(result, form_data, datasource)
+        return self._send_chart_response(result)
 
     # pylint: disable=invalid-name, no-self-use
     def _load_query_context_form_from_cache(self, cache_key: str) -> Dict[str, Any]:
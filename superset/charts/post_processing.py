@@ -23,28 +23,19 @@ to users in reports we want to show the same data they would see
 on Explore.
 
 In order to do that, we reproduce the post-processing in Python
-for these chart types.
+for these chart types. The post-processors run on the dataframe of
+the results, before they are serialized, see ``QueryContextProcessor``.
 """
 
-from io import StringIO
-import csv
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import pandas as pd
 
-from superset import app
-from superset.common.chart_data import ChartDataResultFormat
-from superset.utils.core import (
-    DTTM_ALIAS,
-    extract_dataframe_dtypes,
-    get_column_names,
-    get_metric_names,
-)
+from superset.utils.core import DTTM_ALIAS, get_column_names, get_metric_names
 
 if TYPE_CHECKING:
     from superset.connectors.base.models import BaseDatasource
 
-config = app.config
 
 def get_column_key(label: Tuple[str, ...], metrics: List[str]) -> Tuple[Any, ...]:
     """
@@ -313,59 +304,22 @@ post_processors = {
 }
 
 
-def apply_post_process(
-    result: Dict[Any, Any],
-    form_data: Optional[Dict[str, Any]] = None,
-    datasource: Optional["BaseDatasource"] = None,
-) -> Dict[Any, Any]:
-    form_data = form_data or {}
-
-    encoding = config["CSV_EXPORT"].get("encoding", "utf-8")
-    sep = config["CSV_EXPORT"].get("sep", ";")
-
-    viz_type = form_data.get("viz_type")
-    if viz_type not in post_processors:
-        return result
-
-    post_processor = post_processors[viz_type]
-
-    for query in result["queries"]:
-        if query["result_format"] == ChartDataResultFormat.JSON:
-            df = pd.DataFrame.from_dict(query["data"])
-        elif query["result_format"] == ChartDataResultFormat.CSV:
-            df = pd.read_csv(StringIO(query["data"]), sep=sep, encoding=encoding)
-        else:
-            raise Exception(f"Result format {query['result_format']} not supported")
-
-        processed_df = post_processor(df, form_data, datasource)
-
-        query["colnames"] = list(processed_df.columns)
-        query["indexnames"] = list(processed_df.index)
-        query["coltypes"] = extract_dataframe_dtypes(processed_df, datasource)
-        query["rowcount"] = len(processed_df.index)
-
-        # Flatten hierarchical columns/index since they are represented as
-        # `Tuple[str]`. Otherwise encoding to JSON later will fail because
-        # maps cannot have tuples as their keys in JSON.
-        processed_df.columns = [
-            " ".join(str(name) for name in column).strip()
-            if isinstance(column, tuple)
-            else column
-            for column in processed_df.columns
-        ]
-        processed_df.index = [
-            " ".join(str(name) for name in index).strip()
-            if isinstance(index, tuple)
-            else index
-            for index in processed_df.index
-        ]
-
-        if query["result_format"] == ChartDataResultFormat.JSON:
-            query["data"] = processed_df.to_dict()
-        elif query["result_format"] == ChartDataResultFormat.CSV:
-            buf = StringIO()
-            processed_df.to_csv(buf, sep=sep, encoding=encoding, index=False)
-            buf.seek(0)
-            query["data"] = buf.getvalue()
-
-    return result
+def flatten_multi_index(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten hierarchical columns/index since they are represented as
+    `Tuple[str]`. Otherwise encoding to JSON later will fail because
+    maps cannot have tuples as their keys in JSON.
+    """
+    df.columns = [
+        " ".join(str(name) for name in column).strip()
+        if isinstance(column, tuple)
+        else column
+        for column in df.columns
+    ]
+    df.index = [
+        " ".join(str(name) for name in index).strip()
+        if isinstance(index, tuple)
+        else index
+        for index in df.index
+    ]
+    return df
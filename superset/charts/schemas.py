@@ -1270,6 +1270,10 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        description="Is the cached result past its cache timeout, and being refreshed",
+        allow_none=True,
+    )
     query = fields.String(
         description="The executed query statement",
         required=True,
@@ -1315,6 +1319,13 @@ class ChartDataResponseResult(Schema):
     to_dttm = fields.Integer(
         desciption="End timestamp of time range", required=False, allow_none=True
     )
+    timing = fields.Dict(
+        description="When the query was run concurrently with the other queries of "
+        "the request: the number of queries run concurrently "
+        "(`concurrent_queries`), the duration of this query "
+        "(`query_duration_ms`) and of all of them (`concurrent_duration_ms`).",
+        required=False,
+    )
 
 
 class ChartDataResponseSchema(Schema):
@@ -18,7 +18,7 @@ import json
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
 from apispec import APISpec
@@ -85,6 +85,58 @@ def update_datasources_cache(username: Optional[str]) -> None:
                     print("{}".format(str(ex)))
 
 
+@click.command()
+@with_appcontext
+@click.option(
+    "--dataset",
+    "-d",
+    "dataset_uids",
+    multiple=True,
+    help="Uid of a dataset, eg, 1__table, whose cached results are purged",
+)
+@click.option(
+    "--database",
+    "-b",
+    "database_ids",
+    multiple=True,
+    type=int,
+    help="Id of a database whose cached results are purged",
+)
+@click.option(
+    "--chart",
+    "-c",
+    "chart_ids",
+    multiple=True,
+    type=int,
+    help="Id of a chart whose cached results are purged",
+)
+def invalidate_cache(
+    dataset_uids: Tuple[str, ...],
+    database_ids: Tuple[int, ...],
+    chart_ids: Tuple[int, ...],
+) -> None:
+    """Purge the cached chart results of datasets, databases or charts"""
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+    from superset.utils.cache import (
+        chart_cache_tag,
+        database_cache_tag,
+        invalidate_cache_tags,
+    )
+
+    if not current_app.config["CACHE_INVALIDATION_INDEX_ENABLED"]:
+        click.secho("CACHE_INVALIDATION_INDEX_ENABLED is not set", err=True)
+        sys.exit(1)
+
+    cache_tags = [
+        *dataset_uids,
+        *map(database_cache_tag, database_ids),
+        *map(chart_cache_tag, chart_ids),
+    ]
+    count = invalidate_cache_tags(cache_manager.data_cache, cache_tags)
+    click.secho(f"Invalidated {count} cache keys", fg="green")
+
+
 @click.command()
 @with_appcontext
 def sync_tags() -> None:
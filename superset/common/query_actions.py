@@ -106,6 +106,8 @@ def _get_full(
     df = payload["df"]
     status = payload["status"]
     if status != QueryStatus.FAILED:
+        df = query_context.post_process_df(df)
+        payload["rowcount"] = len(df.index)
         payload["colnames"] = list(df.columns)
         payload["indexnames"] = list(df.index)
         payload["coltypes"] = extract_dataframe_dtypes(df, datasource)
@@ -17,7 +17,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+from contextlib import ExitStack
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import pandas as pd
 
@@ -29,6 +42,7 @@ from superset.common.query_context_processor import (
 from superset.common.query_object import QueryObject
 
 if TYPE_CHECKING:
+    from superset.common.utils.query_cache_manager import QueryCacheManager
     from superset.connectors.base.models import BaseDatasource
     from superset.models.helpers import QueryResult
 
@@ -81,10 +95,13 @@ class QueryContext:
         self.cache_values = cache_values
         self._processor = QueryContextProcessor(self)
 
+    def post_process_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._processor.post_process_df(df)
+
     def get_data(
         self,
         df: pd.DataFrame,
-    ) -> Union[str, List[Dict[str, Any]]]:
+    ) -> Union[str, Iterator[str], List[Dict[str, Any]], Dict[str, Any]]:
         return self._processor.get_data(df)
 
     def get_payload(
@@ -104,6 +121,14 @@ class QueryContext:
             return self.datasource.database.cache_timeout
         return None
 
+    def get_cache_stale_timeout(self) -> Optional[int]:
+        if self.form_data and self.form_data.get("cache_stale_timeout") is not None:
+            return self.form_data["cache_stale_timeout"]
+        datasource_extra = getattr(self.datasource, "extra_dict", {})
+        if datasource_extra.get("cache_stale_timeout") is not None:
+            return datasource_extra["cache_stale_timeout"]
+        return None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> Optional[str]:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
@@ -117,6 +142,31 @@ class QueryContext:
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         return self._processor.get_query_result(query_object)
 
+    def get_query_cache_keys(self) -> Dict[int, Optional[str]]:
+        return self._processor.get_query_cache_keys()
+
+    def load_query_caches(
+        self,
+        force_cached: bool = False,
+        query_caches: Optional[Dict[str, QueryCacheManager]] = None,
+    ) -> None:
+        self._processor.load_query_caches(force_cached, query_caches)
+
+    def prepare_query_results(
+        self,
+        force_cached: bool = False,
+        single_flights: Optional[ExitStack] = None,
+        cache_keys: Optional[Set[str]] = None,
+    ) -> List[Tuple[int, QueryObject, Callable[[], QueryResult]]]:
+        return self._processor.prepare_query_results(
+            force_cached, single_flights, cache_keys
+        )
+
+    def set_prefetched_result(
+        self, query_obj: QueryObject, result: QueryResult
+    ) -> None:
+        self._processor.set_prefetched_result(query_obj, result)
+
     def processing_time_offsets(
         self,
         df: pd.DataFrame,
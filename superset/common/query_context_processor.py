@@ -18,7 +18,26 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+import re
+from contextlib import ExitStack, nullcontext
+from datetime import datetime
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    cast,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -29,7 +48,8 @@ from typing_extensions import TypedDict
 from superset import app
 from superset.annotation_layers.dao import AnnotationLayerDAO
 from superset.charts.dao import ChartDAO
-from superset.common.chart_data import ChartDataResultFormat
+from superset.charts.post_processing import flatten_multi_index, post_processors
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils as df_utils
@@ -44,17 +64,25 @@ from superset.exceptions import (
 from superset.extensions import cache_manager, security_manager
 from superset.models.helpers import QueryResult
 from superset.utils import csv
-from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.cache import (
+    chart_cache_tag,
+    database_cache_tag,
+    generate_cache_key,
+    set_and_log_cache,
+)
+from superset.utils.concurrency import database_slot, run_concurrently
 from superset.utils.core import (
     DTTM_ALIAS,
     error_msg_from_exception,
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.decorators import stats_timing
 from superset.views.utils import get_viz
 
 if TYPE_CHECKING:
@@ -67,12 +95,46 @@ stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
 
 
+# result types whose payload is built from the results of the query
+PREFETCHED_RESULT_TYPES = {
+    ChartDataResultType.FULL,
+    ChartDataResultType.RESULTS,
+    ChartDataResultType.POST_PROCESSED,
+}
+
+
+PostProcessor = Callable[
+    [pd.DataFrame, Dict[str, Any], Optional[BaseDatasource]], pd.DataFrame
+]
+
+
+class OffsetQuery(NamedTuple):
+    offset: str
+    query_object: QueryObject
+    cache_key: Optional[str]
+    cache: QueryCacheManager
+    # runs the query, None if it's cached
+    execute: Optional[Callable[[], QueryResult]]
+
+
 class CachedTimeOffset(TypedDict):
     df: pd.DataFrame
     queries: List[str]
     cache_keys: List[Optional[str]]
 
 
+def run_prepared_query(
+    database_id: Optional[int], execute: Callable[[], QueryResult]
+) -> QueryResult:
+    """
+    Run a query whose SQL was built ahead, within a slot of its database, which is
+    safe to call from another thread.
+    """
+    with database_slot(database_id):
+        with stats_timing("chart_data.prefetch_query", stats_logger):
+            return execute()
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -89,6 +151,15 @@ class QueryContextProcessor:
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        # results of the queries that were run ahead, by query object
+        self._prefetched_results: Dict[int, QueryResult] = {}
+        # cache keys and cached results loaded ahead, by query object
+        self._query_cache_keys: Dict[int, Optional[str]] = {}
+        self._query_caches: Dict[int, QueryCacheManager] = {}
+        # cache keys of the queries that were coalesced by this request
+        self._single_flight_keys: Set[str] = set()
+        # cache keys of the stale results to refresh in the background
+        self._stale_cache_keys: List[str] = []
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -97,46 +168,31 @@ class QueryContextProcessor:
         self, query_obj: QueryObject, force_cached: Optional[bool] = False
     ) -> Dict[str, Any]:
         """Handles caching around the df payload retrieval"""
-        cache_key = self.query_cache_key(query_obj)
-        cache = QueryCacheManager.get(
-            cache_key,
-            CacheRegion.DATA,
-            self._query_context.force,
-            force_cached,
-        )
+        cache_key = self._query_cache_keys.pop(
+            id(query_obj), None
+        ) or self.query_cache_key(query_obj)
+        cache = self._query_caches.pop(id(query_obj), None)
+        if cache is None:
+            cache = QueryCacheManager.get(
+                cache_key,
+                CacheRegion.DATA,
+                self._query_context.force,
+                force_cached,
+            )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                invalid_columns = [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]
-                if invalid_columns:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in datasource: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=self._query_context.force,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            with self.single_flight(cache_key) as coalesced_cache:
+                if coalesced_cache:
+                    # an identical query was run by another request
+                    cache = coalesced_cache
+                else:
+                    self._set_query_result(query_obj, cache_key, cache)
+
+        is_stale = self.is_stale(cache)
+        if is_stale and QueryCacheManager.claim_refresh(
+            cache_key, CacheRegion.DATA, self.get_cache_stale_timeout()
+        ):
+            self._stale_cache_keys.append(cast(str, cache_key))
 
         return {
             "cache_key": cache_key,
@@ -147,6 +203,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -155,19 +212,103 @@ class QueryContextProcessor:
             "to_dttm": query_obj.to_dttm,
         }
 
+    def _set_query_result(
+        self, query_obj: QueryObject, cache_key: str, cache: QueryCacheManager
+    ) -> None:
+        try:
+            self.validate_columns(query_obj)
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=self._query_context.force,
+                timeout=self.get_cache_timeout() + self.get_cache_stale_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+                cache_tags=self.get_cache_tags(),
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
+    def is_stale(self, cache: QueryCacheManager) -> bool:
+        """
+        Whether the cached results are past their cache timeout, in which case they
+        are served while they are refreshed in the background, until they expire
+        after the stale timeout.
+        """
+        if self._query_context.force or not self.get_cache_stale_timeout():
+            return False
+        return cache.is_stale(self.get_cache_timeout())
+
+    def refresh_stale_cache(self) -> None:
+        """
+        Refresh the stale results that were served by this request in a Celery task.
+        """
+        if not self._stale_cache_keys:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        cache_keys, self._stale_cache_keys = self._stale_cache_keys, []
+        form_data = {
+            **self._query_context.cache_values,
+            "form_data": self._query_context.form_data,
+        }
+        try:
+            refresh_chart_data_cache.delay(get_user_id(), form_data, cache_keys)
+            stats_logger.incr("stale_cache.refresh")
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Failed to schedule the refresh of stale results: %s", ex)
+            for cache_key in cache_keys:
+                QueryCacheManager.release_refresh(cache_key, CacheRegion.DATA)
+
+    def single_flight(
+        self, cache_key: str
+    ) -> ContextManager[Optional[QueryCacheManager]]:
+        """
+        Coalesce the query with identical queries of other requests, unless the
+        results are forced to be refreshed, or the lock is already held by this
+        request (see ``prefetch_query_results``).
+        """
+        if self._query_context.force or cache_key in self._single_flight_keys:
+            return nullcontext()
+        self._single_flight_keys.add(cache_key)
+        return QueryCacheManager.single_flight(cache_key, CacheRegion.DATA)
+
+    def validate_columns(self, query_obj: QueryObject) -> None:
+        invalid_columns = [
+            col
+            for col in get_column_names_from_columns(query_obj.columns)
+            + get_column_names_from_metrics(query_obj.metrics or [])
+            if (col not in self._qc_datasource.column_names and col != DTTM_ALIAS)
+        ]
+        if invalid_columns:
+            raise QueryObjectValidationError(
+                _(
+                    "Columns missing in datasource: %(invalid_columns)s",
+                    invalid_columns=invalid_columns,
+                )
+            )
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> Optional[str]:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        if not config["CACHE_INVALIDATION_INDEX_ENABLED"]:
+            # otherwise the cached results are purged when the dataset is edited
+            kwargs["changed_on"] = datasource.changed_on
 
         cache_key = (
             query_obj.cache_key(
                 datasource=datasource.uid,
                 extra_cache_keys=extra_cache_keys,
                 rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
                 **kwargs,
             )
             if query_obj
@@ -175,6 +316,20 @@ class QueryContextProcessor:
         )
         return cache_key
 
+    def get_cache_tags(self) -> List[str]:
+        """
+        Returns the tags the cached results can be invalidated by, besides the uid of
+        the datasource
+        """
+        cache_tags = []
+        database = getattr(self._qc_datasource, "database", None)
+        if database:
+            cache_tags.append(database_cache_tag(database.id))
+        slice_id = (self._query_context.form_data or {}).get("slice_id")
+        if slice_id:
+            cache_tags.append(chart_cache_tag(slice_id))
+        return cache_tags
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
         query_context = self._query_context
@@ -183,7 +338,9 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         # The datasource here can be different backend but the interface is common
-        result = query_context.datasource.query(query_object.to_dict())
+        result = self._prefetched_results.pop(id(query_object), None)
+        if result is None:
+            result = query_context.datasource.query(query_object.to_dict())
         query = result.query + ";\n\n"
 
         df = result.df
@@ -243,8 +400,6 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: List[str] = []
         cache_keys: List[Optional[str]] = []
         rv_dfs: List[pd.DataFrame] = [df]
@@ -252,7 +407,11 @@ class QueryContextProcessor:
         time_offsets = query_object.time_offsets
         outer_from_dttm = query_object.from_dttm
         outer_to_dttm = query_object.to_dttm
+        offset_clones: List[Tuple[str, QueryObject, Optional[str]]] = []
+        offset_queries: List[OffsetQuery] = []
         for offset in time_offsets:
+            # ensure query_object is immutable
+            query_object_clone = copy.copy(query_object)
             try:
                 query_object_clone.from_dttm = get_past_or_future(
                     offset,
@@ -276,14 +435,44 @@ class QueryContextProcessor:
                 )
             # `offset` is added to the hash function
             cache_key = self.query_cache_key(query_object_clone, time_offset=offset)
-            cache = QueryCacheManager.get(
-                cache_key, CacheRegion.DATA, query_context.force
-            )
+            offset_clones.append((offset, query_object_clone, cache_key))
+
+        # the cached results of all the offsets are loaded in a single round trip
+        caches = QueryCacheManager.get_many(
+            [cache_key for _, _, cache_key in offset_clones],
+            CacheRegion.DATA,
+            query_context.force,
+        )
+        for offset, query_object_clone, cache_key in offset_clones:
+            cache = caches[cache_key] if cache_key else QueryCacheManager()
             # whether hit on the cache
             if cache.is_loaded:
+                offset_queries.append(
+                    OffsetQuery(offset, query_object_clone, cache_key, cache, None)
+                )
+                continue
+
+            # the SQL is built in this thread, only the queries are run concurrently
+            offset_queries.append(
+                OffsetQuery(
+                    offset,
+                    query_object_clone,
+                    cache_key,
+                    cache,
+                    self._qc_datasource.prepare_query(query_object_clone.to_dict()),
+                )
+            )
+
+        results = self._run_offset_queries(offset_queries)
+
+        for offset_query, result in zip(offset_queries, results):
+            offset = offset_query.offset
+            query_object_clone = offset_query.query_object
+            cache = offset_query.cache
+            if result is None:
                 rv_dfs.append(cache.df)
                 queries.append(cache.query)
-                cache_keys.append(cache_key)
+                cache_keys.append(offset_query.cache_key)
                 continue
 
             query_object_clone_dct = query_object_clone.to_dict()
@@ -296,7 +485,6 @@ class QueryContextProcessor:
             }
             join_keys = [col for col in df.columns if col not in metrics_mapping.keys()]
 
-            result = self._qc_datasource.query(query_object_clone_dct)
             queries.append(result.query)
             cache_keys.append(None)
 
@@ -350,29 +538,108 @@ class QueryContextProcessor:
                 "query": result.query,
             }
             cache.set(
-                key=cache_key,
+                key=offset_query.cache_key,
                 value=value,
                 timeout=self.get_cache_timeout(),
                 datasource_uid=query_context.datasource.uid,
                 region=CacheRegion.DATA,
+                cache_tags=self.get_cache_tags(),
             )
             rv_dfs.append(offset_slice)
 
         rv_df = pd.concat(rv_dfs, axis=1, copy=False) if time_offsets else df
         return CachedTimeOffset(df=rv_df, queries=queries, cache_keys=cache_keys)
 
-    def get_data(self, df: pd.DataFrame) -> Union[str, List[Dict[str, Any]]]:
+    def _run_offset_queries(
+        self, offset_queries: List[OffsetQuery]
+    ) -> List[Optional[QueryResult]]:
+        """
+        Run the time comparison queries that are not cached concurrently, and return
+        their results in order, with None for the cached ones.
+        """
+        database = getattr(self._qc_datasource, "database", None)
+        database_id = database.id if database else None
+
+        def timed(offset: str, execute: Callable[[], QueryResult]) -> QueryResult:
+            stats_key = "time_offset_query." + re.sub(r"\W+", "_", offset.strip())
+            with database_slot(database_id):
+                with stats_timing(stats_key, stats_logger):
+                    return execute()
+
+        pending = [
+            offset_query for offset_query in offset_queries if offset_query.execute
+        ]
+        pending_results = iter(
+            run_concurrently(
+                [
+                    partial(timed, offset_query.offset, offset_query.execute)
+                    for offset_query in pending
+                ],
+                max_workers=config["CHART_DATA_MAX_WORKERS"],
+            )
+        )
+        return [
+            next(pending_results) if offset_query.execute else None
+            for offset_query in offset_queries
+        ]
+
+    def get_post_processor(self) -> Optional[PostProcessor]:
+        """
+        Returns the function that post-processes the results of the chart like it
+        is done on Explore, for post-processed results of text-based charts, eg, the
+        pivot table, see ``superset.charts.post_processing``.
+        """
+        if self._query_context.result_type != ChartDataResultType.POST_PROCESSED:
+            return None
+        form_data = self._query_context.form_data or {}
+        return post_processors.get(form_data.get("viz_type"))
+
+    def post_process_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        post_processor = self.get_post_processor()
+        if post_processor is None:
+            return df
+
         if self._query_context.result_format == ChartDataResultFormat.CSV:
-            include_index = not isinstance(df.index, pd.RangeIndex)
-            columns = list(df.columns)
             verbose_map = self._qc_datasource.data.get("verbose_map", {})
             if verbose_map:
+                df = df.rename(columns=verbose_map)
+        return post_processor(
+            df, self._query_context.form_data or {}, self._qc_datasource
+        )
+
+    def get_data(
+        self, df: pd.DataFrame
+    ) -> Union[str, Iterator[str], List[Dict[str, Any]], Dict[str, Any]]:
+        # the dataframe was post-processed by ``post_process_df``
+        post_processed = self.get_post_processor() is not None
+        if post_processed:
+            df = flatten_multi_index(df)
+
+        if self._query_context.result_format == ChartDataResultFormat.CSV:
+            include_index = not post_processed and not isinstance(
+                df.index, pd.RangeIndex
+            )
+            columns = list(df.columns)
+            verbose_map = self._qc_datasource.data.get("verbose_map", {})
+            if verbose_map and not post_processed:
                 df.columns = [verbose_map.get(column, column) for column in columns]
+            if config["CSV_STREAMING_ENABLED"]:
+                return csv.dfs_to_escaped_csv(
+                    csv.split_df(
+                        df,
+                        config["CSV_STREAMING_CHUNK_SIZE"],
+                        config["CSV_STREAMING_ROW_LIMIT"],
+                    ),
+                    index=include_index,
+                    **config["CSV_EXPORT"],
+                )
             result = csv.df_to_escaped_csv(
                 df, index=include_index, **config["CSV_EXPORT"]
             )
             return result or ""
 
+        if post_processed:
+            return df.to_dict()
         return df.to_dict(orient="records")
 
     def get_payload(
@@ -382,16 +649,26 @@ class QueryContextProcessor:
     ) -> Dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        # the locks of the queries that are run ahead are held until their
+        # results are cached
+        self.load_query_caches(force_cached)
+        with ExitStack() as single_flights:
+            timings = self.prefetch_query_results(force_cached, single_flights)
+
+            # Get all the payloads from the QueryObjects
+            query_results = [
+                get_query_results(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self._query_context.queries
+            ]
+        for query_result, timing in zip(query_results, timings):
+            if timing:
+                query_result["timing"] = timing
+        self.refresh_stale_cache()
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -406,12 +683,196 @@ class QueryContextProcessor:
 
         return return_value
 
+    def prefetch_query_results(
+        self,
+        force_cached: bool = False,
+        single_flights: Optional[ExitStack] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run the queries of the query objects that are not cached concurrently, ahead
+        of building their payloads one after the other.
+
+        :param force_cached: Whether the results must be loaded from the cache
+        :param single_flights: Holds the locks that coalesce the queries that are
+            run ahead with identical queries of other requests, which must be held
+            until the results are cached
+        :returns: The timing of the queries that were run ahead, for each query object
+        """
+        query_context = self._query_context
+        max_workers = config["CHART_DATA_MAX_WORKERS"]
+        timings: List[Optional[Dict[str, Any]]] = [None] * len(query_context.queries)
+        if max_workers <= 1 or len(query_context.queries) < 2:
+            return timings
+
+        prepared = self.prepare_query_results(force_cached, single_flights)
+        if len(prepared) < 2:
+            # not worth a thread pool, run the query when building the payload
+            return timings
+
+        start = datetime.now()
+        results = run_concurrently(
+            [execute for _, _, execute in prepared],
+            max_workers=max_workers,
+        )
+        elapsed = datetime.now() - start
+        for (idx, query_obj, _), result in zip(prepared, results):
+            self.set_prefetched_result(query_obj, result)
+            timings[idx] = {
+                "concurrent_queries": len(prepared),
+                "query_duration_ms": int(result.duration.total_seconds() * 1000),
+                "concurrent_duration_ms": int(elapsed.total_seconds() * 1000),
+            }
+        return timings
+
+    def prepare_query_results(
+        self,
+        force_cached: bool = False,
+        single_flights: Optional[ExitStack] = None,
+        cache_keys: Optional[Set[str]] = None,
+    ) -> List[Tuple[int, QueryObject, Callable[[], QueryResult]]]:
+        """
+        Build the SQL of the queries of the query objects that are not cached, so
+        that they can be run ahead, in other threads, and their results set with
+        ``set_prefetched_result``.
+
+        The SQL of the queries is built in the current thread, a query object whose
+        SQL can't be built is left to the payload, which reports the error.
+
+        :param force_cached: Whether the results must be loaded from the cache
+        :param single_flights: Holds the locks that coalesce the queries that are
+            run ahead with identical queries of other requests
+        :param cache_keys: The cache keys of the queries that are already run ahead,
+            eg by the other charts of a dashboard, the keys of the prepared queries
+            are added to it
+        :returns: The index, query object and query to run, for each query object
+        """
+        query_context = self._query_context
+        prepared: List[Tuple[int, QueryObject, Callable[[], QueryResult]]] = []
+        if force_cached:
+            return prepared
+
+        if cache_keys is None:
+            cache_keys = set()
+        database = getattr(self._qc_datasource, "database", None)
+        database_id = database.id if database else None
+        for idx, query_obj in enumerate(query_context.queries):
+            result_type = query_obj.result_type or query_context.result_type
+            if (
+                result_type not in PREFETCHED_RESULT_TYPES
+                or id(query_obj) in self._prefetched_results
+            ):
+                continue
+            try:
+                cache_key = self._query_cache_keys.get(
+                    id(query_obj)
+                ) or self.query_cache_key(query_obj)
+                if (
+                    not cache_key
+                    # identical queries are cached by the first one
+                    or cache_key in cache_keys
+                    or (
+                        not query_context.force
+                        and self._is_cached(query_obj, cache_key)
+                    )
+                ):
+                    continue
+                cache_keys.add(cache_key)
+                self.validate_columns(query_obj)
+                if single_flights is not None and single_flights.enter_context(
+                    self.single_flight(cache_key)
+                ):
+                    # an identical query was run by another request
+                    continue
+                execute = partial(
+                    run_prepared_query,
+                    database_id,
+                    self._qc_datasource.prepare_query(query_obj.to_dict()),
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.debug("Not prefetching query %s: %s", idx, ex)
+                continue
+            prepared.append((idx, query_obj, execute))
+        return prepared
+
+    def get_query_cache_keys(self) -> Dict[int, Optional[str]]:
+        """
+        Returns the cache keys of the query objects whose results can be loaded
+        ahead, by query object, None if the cache key can't be computed.
+        """
+        query_context = self._query_context
+        for query_obj in query_context.queries:
+            result_type = query_obj.result_type or query_context.result_type
+            if (
+                result_type not in PREFETCHED_RESULT_TYPES
+                or id(query_obj) in self._query_cache_keys
+            ):
+                continue
+            try:
+                cache_key = self.query_cache_key(query_obj)
+            except Exception as ex:  # pylint: disable=broad-except
+                # the error is reported by the payload
+                logger.debug("Cache key can't be computed: %s", ex)
+                cache_key = None
+            self._query_cache_keys[id(query_obj)] = cache_key
+        return self._query_cache_keys
+
+    def load_query_caches(
+        self,
+        force_cached: bool = False,
+        query_caches: Optional[Dict[str, QueryCacheManager]] = None,
+    ) -> None:
+        """
+        Load the cached results of the query objects ahead of building their
+        payloads, in a single round trip to the cache when the backend supports it.
+
+        :param force_cached: Whether the results must be loaded from the cache
+        :param query_caches: The query caches that were already loaded, by cache
+            key, eg with the ones of the other charts of a dashboard
+        """
+        cache_keys = {
+            query_id: cache_key
+            for query_id, cache_key in self.get_query_cache_keys().items()
+            if cache_key and query_id not in self._query_caches
+        }
+        if not cache_keys:
+            return
+        if query_caches is None:
+            query_caches = QueryCacheManager.get_many(
+                cache_keys.values(),
+                CacheRegion.DATA,
+                self._query_context.force,
+                force_cached,
+            )
+        for query_id, cache_key in cache_keys.items():
+            # the dataframe of a cached result isn't shared by the query objects
+            query_cache = query_caches.pop(cache_key, None)
+            if query_cache is not None:
+                self._query_caches[query_id] = query_cache
+
+    def _is_cached(self, query_obj: QueryObject, cache_key: str) -> bool:
+        query_cache = self._query_caches.get(id(query_obj))
+        if query_cache is not None:
+            return query_cache.is_loaded
+        return QueryCacheManager.has(cache_key, CacheRegion.DATA)
+
+    def set_prefetched_result(
+        self, query_obj: QueryObject, result: QueryResult
+    ) -> None:
+        """Set the result of a query that was run ahead of building its payload."""
+        self._prefetched_results[id(query_obj)] = result
+
     def get_cache_timeout(self) -> int:
         cache_timeout_rv = self._query_context.get_cache_timeout()
         if cache_timeout_rv:
             return cache_timeout_rv
         return config["CACHE_DEFAULT_TIMEOUT"]
 
+    def get_cache_stale_timeout(self) -> int:
+        cache_stale_timeout_rv = self._query_context.get_cache_stale_timeout()
+        if cache_stale_timeout_rv is not None:
+            return cache_stale_timeout_rv
+        return config["CHART_DATA_CACHE_STALE_TIMEOUT"] or 0
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
@@ -17,18 +17,25 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import pyarrow as pa
 from flask_caching import Cache
+from flask_caching.backends.base import BaseCache
 from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
-from superset.extensions import cache_manager
+from superset.extensions import cache_manager, local_data_cache
 from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
+from superset.utils.arrow import arrow_ipc_to_df, can_serialize_df, df_to_arrow_ipc
 from superset.utils.cache import set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
@@ -42,6 +49,57 @@ _cache: Dict[CacheRegion, Cache] = {
 }
 
 
+def has_native_get_many(cache: Cache) -> bool:
+    """
+    Whether the backend of the cache loads several keys in a single round trip,
+    rather than one after the other.
+    """
+    return getattr(type(cache.cache), "get_many", None) not in (
+        None,
+        BaseCache.get_many,
+    )
+
+
+def encode_df(value: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the dataframe of a cache value by its Arrow IPC stream, when enabled
+    through ``CHART_DATA_CACHE_DF_FORMAT``.
+    """
+    df = value.get("df")
+    if (
+        config["CHART_DATA_CACHE_DF_FORMAT"] != "arrow"
+        or not isinstance(df, DataFrame)
+        or not can_serialize_df(df)
+    ):
+        return value
+    try:
+        payload = df_to_arrow_ipc(df, config["CHART_DATA_CACHE_ARROW_COMPRESSION"])
+    except (pa.ArrowException, ValueError, TypeError) as ex:
+        logger.debug("Dataframe can't be serialized to Arrow, pickling: %s", ex)
+        return value
+    return {**value, "df": payload, "df_format": "arrow"}
+
+
+def decode_df(value: Dict[str, Any]) -> DataFrame:
+    """
+    Return the dataframe of a cache value, regardless of the format it was stored in.
+    """
+    if value.get("df_format") == "arrow":
+        return arrow_ipc_to_df(value["df"])
+    return value["df"]
+
+
+def decode_value(value: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a cache value with its dataframe deserialized.
+    """
+    if value.get("df_format") != "arrow":
+        return value
+    decoded = {**value, "df": decode_df(value)}
+    del decoded["df_format"]
+    return decoded
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -75,6 +133,16 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
 
+    def is_stale(self, timeout: int) -> bool:
+        """
+        Whether the value was loaded from the cache more than ``timeout`` seconds
+        after it was cached
+        """
+        if not self.is_cached or not self.cache_dttm:
+            return False
+        cache_dttm = datetime.fromisoformat(self.cache_dttm)
+        return datetime.utcnow() - cache_dttm > timedelta(seconds=timeout)
+
     # pylint: disable=too-many-arguments
     def set_query_result(
         self,
@@ -85,6 +153,7 @@ class QueryCacheManager:
         timeout: Optional[int] = None,
         datasource_uid: Optional[str] = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        cache_tags: Optional[List[str]] = None,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
@@ -116,6 +185,7 @@ class QueryCacheManager:
                     timeout=timeout,
                     datasource_uid=datasource_uid,
                     region=region,
+                    cache_tags=cache_tags,
                 )
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
@@ -136,15 +206,101 @@ class QueryCacheManager:
         Initialize QueryCacheManager by query-cache key
         """
         query_cache = cls()
-        if not key or not _cache[region] or force_query:
-            return query_cache
+        if key and _cache[region] and not force_query:
+            query_cache = cls.from_cache_value(key, cls._get_values([key], region)[0])
+
+        if force_cached and not query_cache.is_loaded:
+            logger.warning(
+                "force_cached (QueryContext): value not found for key %s", key
+            )
+            raise CacheLoadError("Error loading data from cache")
+        return query_cache
+
+    @classmethod
+    def get_many(
+        cls,
+        keys: Iterable[Optional[str]],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        force_query: Optional[bool] = False,
+        force_cached: Optional[bool] = False,
+    ) -> Dict[str, "QueryCacheManager"]:
+        """
+        Initialize a QueryCacheManager for each query-cache key, loading the values
+        in a single round trip when the cache backend supports it (eg, MGET on
+        Redis), or one after the other otherwise.
+
+        :returns: The QueryCacheManager of each key, loaded or not
+        """
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys or not _cache[region] or force_query:
+            values: List[Optional[Dict[str, Any]]] = [None] * len(keys)
+        else:
+            values = cls._get_values(keys, region)
+
+        query_caches = {
+            key: cls.from_cache_value(key, value) for key, value in zip(keys, values)
+        }
+        if force_cached:
+            for key, query_cache in query_caches.items():
+                if not query_cache.is_loaded:
+                    logger.warning(
+                        "force_cached (QueryContext): value not found for key %s", key
+                    )
+                    raise CacheLoadError("Error loading data from cache")
+        return query_caches
+
+    @staticmethod
+    def _get_values(
+        keys: List[str], region: CacheRegion
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Load the values of the keys, from the local data cache first, if enabled,
+        then from the cache backend, in a single round trip when it supports it.
+        """
+        cache = _cache[region]
+        local_cache = local_data_cache if region == CacheRegion.DATA else None
+        if local_cache is not None and not local_cache.enabled:
+            local_cache = None
+
+        values: Dict[str, Optional[Dict[str, Any]]] = {}
+        if local_cache is not None:
+            for key in keys:
+                value = local_cache.get(key)
+                if value is not None:
+                    values[key] = value
+        missing = [key for key in keys if key not in values]
+        if len(missing) > 1 and has_native_get_many(cache):
+            remote_values = cache.get_many(*missing)
+            stats_logger.incr("cache.get_many")
+            stats_logger.gauge("cache.get_many.round_trips_saved", len(missing) - 1)
+        else:
+            remote_values = [cache.get(key) for key in missing]
 
-        cache_value = _cache[region].get(key)
+        for key, value in zip(missing, remote_values):
+            if local_cache is not None:
+                stats_logger.incr(
+                    "data_cache.remote.hits" if value else "data_cache.remote.misses"
+                )
+                if value:
+                    # the dataframe is only deserialized once
+                    value = decode_value(value)
+                    local_cache.set(key, value)
+            values[key] = value
+        return [values[key] for key in keys]
+
+    @classmethod
+    def from_cache_value(
+        cls, key: str, cache_value: Optional[Dict[str, Any]]
+    ) -> "QueryCacheManager":
+        """
+        Initialize QueryCacheManager from the value of a query-cache key
+        """
+        query_cache = cls()
         if cache_value:
             logger.info("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = decode_df(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -166,12 +322,6 @@ class QueryCacheManager:
                     exc_info=True,
                 )
             logger.info("Serving from cache")
-
-        if force_cached and not query_cache.is_loaded:
-            logger.warning(
-                "force_cached (QueryContext): value not found for key %s", key
-            )
-            raise CacheLoadError("Error loading data from cache")
         return query_cache
 
     @staticmethod
@@ -181,12 +331,28 @@ class QueryCacheManager:
         timeout: Optional[int] = None,
         datasource_uid: Optional[str] = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        cache_tags: Optional[List[str]] = None,
     ) -> None:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+            dttm = set_and_log_cache(
+                _cache[region],
+                key,
+                encode_df(value),
+                timeout,
+                datasource_uid,
+                cache_tags,
+            )
+            if region == CacheRegion.DATA and local_data_cache.enabled:
+                local_data_cache.invalidate([key])
+                if dttm:
+                    # the dataframe is handed over to the caller, which may modify it
+                    df = value.get("df")
+                    if isinstance(df, DataFrame):
+                        value = {**value, "df": df.copy()}
+                    local_data_cache.set(key, {**value, "dttm": dttm})
 
     @staticmethod
     def delete(
@@ -195,10 +361,82 @@ class QueryCacheManager:
     ) -> None:
         if key:
             _cache[region].delete(key)
+            if region == CacheRegion.DATA and local_data_cache.enabled:
+                local_data_cache.invalidate([key])
 
     @staticmethod
     def has(
         key: Optional[str],
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> bool:
-        return bool(_cache[region].get(key)) if key else False
+        return bool(_cache[region] and key and _cache[region].cache.has(key))
+
+    @staticmethod
+    def claim_refresh(
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        timeout: Optional[int] = None,
+    ) -> bool:
+        """
+        Claim the refresh of a stale value, returns False if the value is already
+        being refreshed
+        """
+        if not key or not _cache[region]:
+            return False
+        return bool(_cache[region].add(f"{key}__refresh", True, timeout=timeout))
+
+    @staticmethod
+    def release_refresh(
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> None:
+        if key:
+            _cache[region].delete(f"{key}__refresh")
+
+    @classmethod
+    @contextmanager
+    def single_flight(
+        cls,
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> Iterator[Optional["QueryCacheManager"]]:
+        """
+        Coalesce identical queries that are running at the same time, across
+        processes, through a lock stored in the cache.
+
+        The first request to miss the cache holds the lock while it runs the query,
+        and yields None. The other requests wait for the lock to be released, for up
+        to ``CHART_DATA_SINGLE_FLIGHT_TIMEOUT`` seconds, then yield the query cache
+        loaded from the key, or None if the value is still missing, in which case
+        they run the query themselves.
+        """
+        if not key or not config["CHART_DATA_SINGLE_FLIGHT_ENABLED"]:
+            yield None
+            return
+
+        cache = _cache[region]
+        lock_key = f"{key}__single_flight"
+        timeout = config["CHART_DATA_SINGLE_FLIGHT_TIMEOUT"]
+        token = uuid.uuid4().hex
+        if cache.add(lock_key, token, timeout=timeout):
+            stats_logger.incr("single_flight.leader")
+            try:
+                yield None
+            finally:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+            return
+
+        deadline = time.monotonic() + timeout
+        poll_interval = config["CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL"]
+        while cache.cache.has(lock_key) and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+
+        query_cache = cls.get(key, region)
+        if query_cache.is_loaded:
+            logger.info("Coalesced with an identical query: %s", key)
+            stats_logger.incr("single_flight.coalesced")
+            yield query_cache
+        else:
+            stats_logger.incr("single_flight.missed")
+            yield None
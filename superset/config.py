@@ -582,6 +582,20 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# The chart data loaded from, or written to, the data cache are also kept in a
+# process-local LRU cache, with their dataframes deserialized, for up to
+# ``DATA_CACHE_LOCAL_TIMEOUT`` seconds and up to ``DATA_CACHE_LOCAL_MAX_BYTES`` in
+# total (as estimated from the memory used by the dataframes) per process. When the
+# data cache is stored in Redis, the processes notify each other of the keys that
+# are written or deleted through the ``DATA_CACHE_LOCAL_INVALIDATION_CHANNEL``
+# pub/sub channel, otherwise the local copies can be out of date until they expire.
+# The hits, misses and evictions of the local cache are reported to the stats
+# logger under ``data_cache.local``, and the ones of the data cache under
+# ``data_cache.remote``. Set to 0 to disable.
+DATA_CACHE_LOCAL_MAX_BYTES = 0
+DATA_CACHE_LOCAL_TIMEOUT = 30
+DATA_CACHE_LOCAL_INVALIDATION_CHANNEL = "superset_data_cache_invalidation"
+
 # Cache for dashboard filter state (`CACHE_TYPE` defaults to `SimpleCache` when
 #  running in debug mode unless overridden)
 FILTER_STATE_CACHE_CONFIG: CacheConfig = {
@@ -601,6 +615,50 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Index the cache keys of the chart data cache by dataset, database and chart, in
+# the cache backend itself (native sets with Redis), so that the cached results can be
+# purged when a dataset is edited, or through the /api/v1/cachekey/invalidate endpoint
+# and the `superset invalidate-cache` command, eg, when an ETL job refreshes a table.
+# As edited datasets purge their results, their last modification time is then left
+# out of the cache keys, which makes longer cache timeouts safe.
+CACHE_INVALIDATION_INDEX_ENABLED = False
+
+# Format of the dataframes stored in the chart data cache. With "pickle" the
+# dataframes are pickled by the cache backend as is, while "arrow" stores them as an
+# Arrow IPC stream, which is smaller and much faster to load for wide results.
+# Dataframes that can't be represented in Arrow are always pickled. Entries written in
+# either format can be read regardless of this setting.
+CHART_DATA_CACHE_DF_FORMAT = "pickle"
+
+# Buffer compression of the Arrow IPC streams in the chart data cache: "lz4", "zstd"
+# or None
+CHART_DATA_CACHE_ARROW_COMPRESSION: Optional[str] = None
+
+# Serve cached chart results for up to this many seconds past their cache timeout,
+# flagged with "is_stale", while a Celery worker refreshes them in the background,
+# instead of running the query on the next request. After that, they expire as usual.
+# Charts and datasets opt in with a "cache_stale_timeout" in their params and extra,
+# which take precedence over this default.
+CHART_DATA_CACHE_STALE_TIMEOUT: Optional[int] = None
+
+# Coalesce identical chart queries that run at the same time, eg, when a popular
+# dashboard is opened right after its cache expired: the first request runs the query
+# while holding a lock in the data cache, and the other ones wait for its result to be
+# cached, for up to CHART_DATA_SINGLE_FLIGHT_TIMEOUT seconds, before running the query
+# themselves. The data cache needs to be shared by all the web servers (eg, Redis).
+CHART_DATA_SINGLE_FLIGHT_ENABLED = False
+CHART_DATA_SINGLE_FLIGHT_TIMEOUT = 60
+CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL = 0.2
+
+# The queries of a chart that don't depend on each other, such as the time comparison
+# queries ("1 year ago"), are run concurrently in a pool of up to this many threads
+# per request. Set it to 1 to run them one after the other.
+CHART_DATA_MAX_WORKERS = 4
+
+# Maximum number of chart queries that a Superset process runs concurrently against
+# a single database, further queries wait for one to complete. None means no limit.
+DATABASE_MAX_CONCURRENT_QUERIES: Optional[int] = 10
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: Dict[Any, Any] = {}
@@ -624,6 +682,14 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 
 CSV_EXPORT = {"encoding": "utf-8", "sep": ";"}
 
+# Stream CSV exports of chart data and SQL Lab results, instead of building the
+# whole file in memory. SQL Lab results that are not in the results backend are
+# fetched from the database cursor CSV_STREAMING_CHUNK_SIZE rows at a time, and
+# streamed exports are truncated to CSV_STREAMING_ROW_LIMIT rows.
+CSV_STREAMING_ENABLED = False
+CSV_STREAMING_CHUNK_SIZE = 10000
+CSV_STREAMING_ROW_LIMIT = 1000000
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -1033,6 +1099,25 @@ DASHBOARD_TEMPLATE_ID = None
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Keep a bounded, per-process registry of SQLAlchemy engines for the databases
+# connected to Superset, so that queries reuse pooled connections instead of opening
+# a new connection (``NullPool``) every time. Engines are keyed by database and by
+# their final URL and parameters, which include the schema, the effective user, the
+# impersonation config and the output of ``DB_CONNECTION_MUTATOR``. Engines unused
+# for ``ENGINE_POOL_IDLE_TIMEOUT`` seconds are disposed, as are the engines of a
+# database when it is edited. ``ENGINE_POOL_PARAMS`` are passed to `create_engine`
+# and can be overridden per database through ``engine_params`` in its extra.
+ENGINE_POOL_ENABLED = False
+ENGINE_POOL_MAX_ENGINES = 50
+ENGINE_POOL_IDLE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+ENGINE_POOL_PARAMS: Dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": int(timedelta(hours=1).total_seconds()),
+    "pool_pre_ping": True,
+}
+
 
 # A function that intercepts the SQL to be executed and can alter it.
 # The use case is can be around adding some sort of comment header
@@ -1055,6 +1140,21 @@ def SQL_QUERY_MUTATOR(  # pylint: disable=invalid-name,unused-argument
     return sql
 
 
+# The SQL generated for charts is kept in a process-local LRU cache of this many
+# queries, keyed by the query object and by the definition of the dataset, its
+# columns and metrics, its database and the row level security filters of the user.
+# Queries whose dataset, filters or security rules use Jinja templating, or which
+# depend on the results of a prequery, are never cached. ``SQL_QUERY_MUTATOR`` is
+# applied after the cache. Hits, misses, evictions and the time saved by hits are
+# reported to the stats logger under ``compiled_query_cache``. Set to 0 to disable.
+COMPILED_QUERY_CACHE_SIZE = 0
+
+# Whether the SQL generated for charts is reindented with ``sqlparse``, which makes
+# it easier to read in the "View query" modal and in the query logs but can take
+# tens of milliseconds for wide queries.
+SQL_QUERY_REFORMAT = True
+
+
 # This auth provider is used by background (offline) tasks that need to access
 # protected resources. Can be overridden by end users in order to support
 # custom auth mechanisms
@@ -1180,6 +1280,14 @@ TALISMAN_CONFIG = {
 # }
 RLS_FORM_QUERY_REL_FIELDS: Optional[Dict[str, List[List[Any]]]] = None
 
+# The security lookups that query the metadata database, ie, the roles of the user,
+# the row level security filters of a table and the permissions checks, are memoized
+# for the duration of each request. They can also be cached across requests, in the
+# default cache (CACHE_CONFIG), for this many seconds. Changes to the roles,
+# permissions or row level security filters invalidate them, across processes if the
+# default cache is shared. The hits are counted as "security_cache.*" stats.
+SECURITY_CACHE_TIMEOUT = 0
+
 #
 # Flask session cookie options
 #
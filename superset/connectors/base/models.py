@@ -19,7 +19,18 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Hashable, List, Optional, Set, Type, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 from flask_appbuilder.security.sqla.models import User
 from sqlalchemy import and_, Boolean, Column, Integer, String, Text
@@ -461,6 +472,16 @@ class BaseDatasource(
         """
         raise NotImplementedError()
 
+    def prepare_query(self, query_obj: QueryObjectDict) -> Callable[[], QueryResult]:
+        """Prepares the query, and returns a function that executes it
+
+        Everything that needs the metadata database must be done when preparing
+        the query, so that the returned function can be called from another
+        thread. By default the query is executed right away.
+        """
+        result = self.query(query_obj)
+        return lambda: result
+
     def values_for_column(self, column_name: str, limit: int = 10000) -> List[Any]:
         """Given a column, returns an iterable of distinct values
 
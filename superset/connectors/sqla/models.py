@@ -22,12 +22,14 @@ import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from timeit import default_timer
 from typing import (
     Any,
     Callable,
     cast,
     Dict,
     Hashable,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -63,6 +65,7 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    tuple_,
     update,
 )
 from sqlalchemy.engine.base import Connection
@@ -71,7 +74,7 @@ from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import column, ColumnElement, literal_column, table
-from sqlalchemy.sql.elements import ColumnClause, TextClause
+from sqlalchemy.sql.elements import ColumnClause, Grouping, TextClause
 from sqlalchemy.sql.expression import Label, Select, TextAsFrom
 from sqlalchemy.sql.selectable import Alias, TableClause
 
@@ -94,7 +97,7 @@ from superset.exceptions import (
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
-from superset.extensions import feature_flag_manager
+from superset.extensions import compiled_query_cache, feature_flag_manager
 from superset.jinja_context import (
     BaseTemplateProcessor,
     ExtraCache,
@@ -132,12 +135,14 @@ from superset.utils.core import (
     QueryObjectFilterClause,
     remove_duplicates,
 )
+from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
 
 config = app.config
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 VIRTUAL_TABLE_ALIAS = "virtual_table"
+JINJA_REGEX = re.compile(r"{[{%#]")
 
 # a non-exhaustive set of additive metrics
 ADDITIVE_METRIC_TYPES = {
@@ -976,17 +981,96 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
     def get_template_processor(self, **kwargs: Any) -> BaseTemplateProcessor:
         return get_template_processor(table=self, database=self.database, **kwargs)
 
+    def get_compiled_query_key(self, query_obj: QueryObjectDict) -> Optional[str]:
+        """
+        Return the fingerprint of the SQL generated for a query object, which is the
+        key of the compiled query cache, or ``None`` when the SQL can't be cached,
+        i.e. when the dataset has unsaved changes or when the dataset, the query or
+        the row level security filters use Jinja templating.
+
+        :param query_obj: The query object
+        :returns: The fingerprint of the query, if it can be cached
+        """
+        objects = [self, self.database, *self.columns, *self.metrics]
+        for obj in objects:
+            state = sa.inspect(obj)
+            if not state.has_identity or state.modified:
+                return None
+
+        try:
+            query_obj_json = json.dumps(
+                query_obj, default=utils.json_iso_dttm_ser, sort_keys=True
+            )
+        except TypeError:
+            return None
+
+        rls_clauses: List[str] = []
+        if self.is_rls_supported:
+            rls_clauses += [
+                f"{filter_.group_key}:{filter_.clause}"
+                for filter_ in security_manager.get_rls_filters(self)
+            ]
+            if is_feature_enabled("EMBEDDED_SUPERSET"):
+                rls_clauses += [
+                    rule["clause"]
+                    for rule in security_manager.get_guest_rls_filters(self)
+                ]
+
+        templatable_statements = [
+            self.sql,
+            self.fetch_values_predicate,
+            query_obj_json,
+            *[col.expression for col in self.columns],
+            *[metric.expression for metric in self.metrics],
+            *rls_clauses,
+        ]
+        if any(
+            statement and JINJA_REGEX.search(statement)
+            for statement in templatable_statements
+        ):
+            return None
+
+        return md5_sha_from_dict(
+            {
+                "query_obj": query_obj_json,
+                "dataset": [self.id, self.changed_on],
+                "database": [self.database.id, self.database.changed_on],
+                "columns": [[col.id, col.changed_on] for col in self.columns],
+                "metrics": [[metric.id, metric.changed_on] for metric in self.metrics],
+                "rls": rls_clauses,
+            },
+            default=str,
+        )
+
     def get_query_str_extended(self, query_obj: QueryObjectDict) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)
-        sql = self._apply_cte(sql, sqlaq.cte)
-        sql = sqlparse.format(sql, reindent=True)
-        sql = self.mutate_query_from_config(sql)
-        return QueryStringExtended(
-            applied_template_filters=sqlaq.applied_template_filters,
-            labels_expected=sqlaq.labels_expected,
-            prequeries=sqlaq.prequeries,
-            sql=sql,
+        key = (
+            self.get_compiled_query_key(query_obj)
+            if compiled_query_cache.enabled
+            else None
+        )
+        query_str_ext: Optional[QueryStringExtended] = (
+            compiled_query_cache.get(key) if key else None
+        )
+        if query_str_ext is None:
+            start = default_timer()
+            sqlaq = self.get_sqla_query(**query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)
+            sql = self._apply_cte(sql, sqlaq.cte)
+            if config["SQL_QUERY_REFORMAT"]:
+                sql = sqlparse.format(sql, reindent=True)
+            query_str_ext = QueryStringExtended(
+                applied_template_filters=sqlaq.applied_template_filters,
+                labels_expected=sqlaq.labels_expected,
+                prequeries=sqlaq.prequeries,
+                sql=sql,
+            )
+            # the top groups of series limited queries may depend on the data
+            if key and not sqlaq.prequeries:
+                compiled_query_cache.set(key, query_str_ext, default_timer() - start)
+
+        # the mutator usually depends on the user, so it is never cached
+        return query_str_ext._replace(
+            sql=self.mutate_query_from_config(query_str_ext.sql)
         )
 
     def get_query_str(self, query_obj: QueryObjectDict) -> str:
@@ -1803,7 +1887,7 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
 
     def _normalize_prequery_result_type(
         self,
-        row: pd.Series,
+        row: Union[pd.Series, Dict[str, Any]],
         dimension: str,
         columns_by_name: Dict[str, TableColumn],
     ) -> Union[str, int, float, bool, Text]:
@@ -1826,9 +1910,9 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             value = value.item()
 
         column_ = columns_by_name[dimension]
-        db_extra: Dict[str, Any] = self.database.get_extra()
 
         if column_.type and column_.is_temporal and isinstance(value, str):
+            db_extra: Dict[str, Any] = self.database.get_extra()
             sql = self.db_engine_spec.convert_dttm(
                 column_.type, dateutil.parser.parse(value), db_extra=db_extra
             )
@@ -1845,28 +1929,91 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
         groupby_exprs: Dict[str, Any],
         columns_by_name: Dict[str, TableColumn],
     ) -> ColumnElement:
-        groups = []
-        for _unused, row in df.iterrows():
-            group = []
-            for dimension in dimensions:
-                value = self._normalize_prequery_result_type(
-                    row,
-                    dimension,
-                    columns_by_name,
-                )
+        """
+        Return the predicate that restricts a query to the top groups returned by its
+        prequery.
+
+        Several dimensions are matched with a single tuple ``IN`` when the engine
+        supports it. Otherwise the groups are factored by their leading dimensions, so
+        that the last dimension is matched with ``IN``, which is a single ``IN`` for a
+        single dimension. Groups with null values, which ``IN`` never matches, are
+        matched with equality predicates.
+
+        :param df: The prequery results
+        :param dimensions: The names of the dimensions of the groups
+        :param groupby_exprs: The mapping of dimensions to their SQL expressions
+        :param columns_by_name: The mapping of columns by name
+        :returns: The predicate
+        """
+        if not dimensions:
+            return or_()
+
+        exprs = [groupby_exprs[dimension] for dimension in dimensions]
+        # only temporal values may need to be converted, and checking whether a
+        # column is temporal is too slow to be done for each value
+        temporal_dimensions = {
+            dimension
+            for dimension in dimensions
+            if columns_by_name[dimension].type
+            and columns_by_name[dimension].is_temporal
+        }
+        groups: List[Tuple[Any, ...]] = []
+        null_groups: List[Tuple[Any, ...]] = []
+        for record in df[dimensions].to_dict("records"):
+            group = tuple(
+                self._normalize_prequery_result_type(record, dimension, columns_by_name)
+                if dimension in temporal_dimensions
+                else record[dimension]
+                for dimension in dimensions
+            )
+            if any(value is None for value in group):
+                null_groups.append(group)
+            else:
+                groups.append(group)
 
-                group.append(groupby_exprs[dimension] == value)
-            groups.append(and_(*group))
+        predicates: List[ColumnElement] = []
+        if len(exprs) > 1 and self.db_engine_spec.allows_tuple_in and groups:
+            predicates.append(tuple_(*exprs).in_([tuple_(*group) for group in groups]))
+        else:
+            factored_groups: Dict[Tuple[Any, ...], List[Any]] = defaultdict(list)
+            for group in groups:
+                # ``IN`` only accepts column expressions, such as grouped text clauses
+                value = group[-1]
+                if isinstance(value, TextClause):
+                    value = Grouping(value)
+                factored_groups[group[:-1]].append(value)
+            for leading_values, values in factored_groups.items():
+                predicates.append(
+                    and_(
+                        *[expr == value for expr, value in zip(exprs, leading_values)],
+                        exprs[-1] == values[0]
+                        if len(values) == 1
+                        else exprs[-1].in_(values),
+                    )
+                )
+        for group in null_groups:
+            predicates.append(
+                and_(*[expr == value for expr, value in zip(exprs, group)])
+            )
 
-        return or_(*groups)
+        return or_(*predicates)
 
     def query(self, query_obj: QueryObjectDict) -> QueryResult:
+        return self.prepare_query(query_obj)()
+
+    def prepare_query(self, query_obj: QueryObjectDict) -> Callable[[], QueryResult]:
+        """
+        Build the SQL of the query, which reads the dataset and the security rules
+        from the metadata database, and return a function that only runs it against
+        the analytics database.
+        """
         qry_start_dttm = datetime.now()
         query_str_ext = self.get_query_str_extended(query_obj)
         sql = query_str_ext.sql
-        status = QueryStatus.SUCCESS
-        errors = None
-        error_message = None
+        # the database settings are loaded from the metadata database here too
+        database = self.database
+        schema = self.schema
+        db_engine_spec = self.db_engine_spec
 
         def assign_column_label(df: pd.DataFrame) -> Optional[pd.DataFrame]:
             """
@@ -1893,29 +2040,35 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
                 df.columns = labels_expected
             return df
 
-        try:
-            df = self.database.get_df(sql, self.schema, mutator=assign_column_label)
-        except Exception as ex:  # pylint: disable=broad-except
-            df = pd.DataFrame()
-            status = QueryStatus.FAILED
-            logger.warning(
-                "Query %s on schema %s failed", sql, self.schema, exc_info=True
+        def execute() -> QueryResult:
+            status = QueryStatus.SUCCESS
+            errors = None
+            error_message = None
+            try:
+                df = database.get_df(sql, schema, mutator=assign_column_label)
+            except Exception as ex:  # pylint: disable=broad-except
+                df = pd.DataFrame()
+                status = QueryStatus.FAILED
+                logger.warning(
+                    "Query %s on schema %s failed", sql, schema, exc_info=True
+                )
+                errors = [
+                    dataclasses.asdict(error)
+                    for error in db_engine_spec.extract_errors(ex)
+                ]
+                error_message = utils.error_msg_from_exception(ex)
+
+            return QueryResult(
+                applied_template_filters=query_str_ext.applied_template_filters,
+                status=status,
+                df=df,
+                duration=datetime.now() - qry_start_dttm,
+                query=sql,
+                errors=errors,
+                error_message=error_message,
             )
-            db_engine_spec = self.db_engine_spec
-            errors = [
-                dataclasses.asdict(error) for error in db_engine_spec.extract_errors(ex)
-            ]
-            error_message = utils.error_msg_from_exception(ex)
 
-        return QueryResult(
-            applied_template_filters=query_str_ext.applied_template_filters,
-            status=status,
-            df=df,
-            duration=datetime.now() - qry_start_dttm,
-            query=sql,
-            errors=errors,
-            error_message=error_message,
-        )
+        return execute
 
     def get_sqla_table_object(self) -> Table:
         return self.database.get_table(self.table_name, schema=self.schema)
@@ -2058,6 +2211,58 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             .one()
         )
 
+    @classmethod
+    def get_eager_sqlatable_datasources(
+        cls, session: Session, datasource_ids: Iterable[int]
+    ) -> List["SqlaTable"]:
+        """Returns SqlaTables with their columns, metrics, owners and database."""
+        return (
+            session.query(cls)
+            .options(
+                sa.orm.selectinload(cls.columns),
+                sa.orm.selectinload(cls.metrics),
+                sa.orm.selectinload(cls.owners),
+                sa.orm.joinedload(cls.database),
+            )
+            .filter(cls.id.in_(datasource_ids))
+            .all()
+        )
+
+    @classmethod
+    def get_versions(
+        cls, session: Session, datasource_ids: Iterable[int]
+    ) -> Dict[int, str]:
+        """
+        Return a fingerprint of the definition of each dataset, which changes when
+        the dataset, its columns, metrics or owners, or its database are edited.
+
+        :param session: The metadata database session
+        :param datasource_ids: The ids of the datasets
+        :returns: The mapping of the ids of the existing datasets to their version
+        """
+
+        def correlated(column: ColumnElement, table_id: ColumnElement) -> Any:
+            return select([column]).where(table_id == cls.id).as_scalar()
+
+        query = (
+            session.query(
+                cls.id,
+                cls.changed_on,
+                Database.changed_on,
+                correlated(sa.func.count(TableColumn.id), TableColumn.table_id),
+                correlated(sa.func.max(TableColumn.changed_on), TableColumn.table_id),
+                correlated(sa.func.count(SqlMetric.id), SqlMetric.table_id),
+                correlated(sa.func.max(SqlMetric.changed_on), SqlMetric.table_id),
+                # owners are a plain association, whose rows are only ever added
+                # or removed
+                correlated(sa.func.count(), sqlatable_user.c.table_id),
+                correlated(sa.func.max(sqlatable_user.c.id), sqlatable_user.c.table_id),
+            )
+            .join(Database, cls.database_id == Database.id)
+            .filter(cls.id.in_(datasource_ids))
+        )
+        return {row[0]: md5_sha_from_str(str(row[1:])) for row in query}
+
     @classmethod
     def get_all_datasources(cls, session: Session) -> List["SqlaTable"]:
         qry = session.query(cls)
@@ -2191,6 +2396,31 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             item.to_sl_column(known_columns) for item in self.columns + self.metrics
         ]
 
+    @staticmethod
+    def invalidate_cache(  # pylint: disable=unused-argument
+        mapper: Mapper,
+        connection: Connection,
+        target: Union["SqlaTable", SqlMetric, TableColumn],
+    ) -> None:
+        """
+        Purge the cached results of the dataset when it, or one of its metrics or
+        columns, is changed, see ``CACHE_INVALIDATION_INDEX_ENABLED``.
+
+        :param mapper: Unused.
+        :param connection: Unused.
+        :param target: The dataset, metric or column that was changed.
+        """
+        if not app.config["CACHE_INVALIDATION_INDEX_ENABLED"]:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+        from superset.utils.cache import invalidate_cache_tags
+
+        table = target if isinstance(target, SqlaTable) else target.table
+        if table is not None:
+            invalidate_cache_tags(cache_manager.data_cache, [table.uid])
+
     @staticmethod
     def update_column(  # pylint: disable=unused-argument
         mapper: Mapper, connection: Connection, target: Union[SqlMetric, TableColumn]
@@ -2534,6 +2764,14 @@ sa.event.listen(SqlMetric, "after_update", SqlaTable.update_column)
 sa.event.listen(SqlMetric, "after_delete", SqlMetric.after_delete)
 sa.event.listen(TableColumn, "after_update", SqlaTable.update_column)
 sa.event.listen(TableColumn, "after_delete", TableColumn.after_delete)
+sa.event.listen(SqlaTable, "after_update", SqlaTable.invalidate_cache)
+sa.event.listen(SqlaTable, "after_delete", SqlaTable.invalidate_cache)
+sa.event.listen(SqlMetric, "after_insert", SqlaTable.invalidate_cache)
+sa.event.listen(SqlMetric, "after_update", SqlaTable.invalidate_cache)
+sa.event.listen(SqlMetric, "after_delete", SqlaTable.invalidate_cache)
+sa.event.listen(TableColumn, "after_insert", SqlaTable.invalidate_cache)
+sa.event.listen(TableColumn, "after_update", SqlaTable.invalidate_cache)
+sa.event.listen(TableColumn, "after_delete", SqlaTable.invalidate_cache)
 
 RLSFilterRoles = Table(
     "rls_filter_roles",
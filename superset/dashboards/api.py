@@ -20,10 +20,20 @@ import json
 import logging
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 from zipfile import is_zipfile, ZipFile
 
-from flask import g, make_response, redirect, request, Response, send_file, url_for
+import simplejson
+from flask import (
+    g,
+    make_response,
+    redirect,
+    request,
+    Response,
+    send_file,
+    stream_with_context,
+    url_for,
+)
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.hooks import before_request
@@ -39,6 +49,7 @@ from superset.commands.importers.exceptions import NoValidFilesFoundError
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.dashboards.commands.bulk_delete import BulkDeleteDashboardCommand
+from superset.dashboards.commands.charts_data import DashboardChartsDataCommand
 from superset.dashboards.commands.create import CreateDashboardCommand
 from superset.dashboards.commands.delete import DeleteDashboardCommand
 from superset.dashboards.commands.exceptions import (
@@ -64,6 +75,7 @@ from superset.dashboards.filters import (
     FilterRelatedRoles,
 )
 from superset.dashboards.schemas import (
+    DashboardChartsDataSchema,
     DashboardDatasetSchema,
     DashboardGetResponseSchema,
     DashboardPostSchema,
@@ -83,6 +95,7 @@ from superset.models.dashboard import Dashboard
 from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.utils.cache import etag_cache
+from superset.utils.core import json_int_dttm_ser
 from superset.utils.screenshots import DashboardScreenshot
 from superset.utils.urls import get_url_path
 from superset.views.base import generate_download_headers
@@ -135,6 +148,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         "bulk_delete",  # not using RouteMethod since locally defined
         "favorite_status",
         "get_charts",
+        "get_charts_data",
         "get_datasets",
         "get_embedded",
         "set_embedded",
@@ -250,6 +264,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
     """ Override the name set for this collection of endpoints """
     openapi_spec_component_schemas = (
         ChartEntityResponseSchema,
+        DashboardChartsDataSchema,
         DashboardGetResponseSchema,
         DashboardDatasetSchema,
         GetFavStarIdsSchema,
@@ -455,6 +470,81 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         except DashboardNotFoundError:
             return self.response_404()
 
+    @expose("/<id_or_slug>/charts/data", methods=["POST"])
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".get_charts_data",
+        log_to_statsd=False,
+    )
+    def get_charts_data(self, id_or_slug: str) -> Response:
+        """Gets the data of the charts of a dashboard
+        ---
+        post:
+          description: >-
+            Get the data of the charts of a dashboard, from their saved query
+            contexts, in a single request. The extra form data, eg the state of the
+            native filters, is applied to the charts. A JSON object is streamed per
+            chart, one per line, as soon as its data is available.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: id_or_slug
+          requestBody:
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/DashboardChartsDataSchema'
+          responses:
+            200:
+              description: >-
+                The data of each chart, or the error that occurred, one chart
+                per line
+              content:
+                application/x-ndjson:
+                  schema:
+                    type: object
+                    properties:
+                      chart_id:
+                        type: integer
+                      result:
+                        type: array
+                        items:
+                          $ref: '#/components/schemas/ChartDataResponseResult'
+                      error:
+                        type: string
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        try:
+            item = DashboardChartsDataSchema().load(request.get_json(silent=True) or {})
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+        command = DashboardChartsDataCommand(id_or_slug, **item)
+        try:
+            command.validate()
+        except DashboardAccessDeniedError:
+            return self.response_403()
+        except DashboardNotFoundError:
+            return self.response_404()
+
+        def stream() -> Iterator[str]:
+            for chart_data in command.run():
+                yield simplejson.dumps(
+                    chart_data, default=json_int_dttm_ser, ignore_nan=True
+                ) + "\n"
+
+        return Response(stream_with_context(stream()), mimetype="application/x-ndjson")
+
     @expose("/", methods=["POST"])
     @protect()
     @safe
@@ -0,0 +1,228 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+import logging
+from concurrent.futures import as_completed, Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from flask import current_app
+from flask_babel import gettext as _
+from marshmallow import ValidationError
+
+from superset import db
+from superset.charts.commands.exceptions import ChartDataQueryFailedError
+from superset.charts.data.commands.get_data_command import ChartDataCommand
+from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.commands.base import BaseCommand
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.common.query_object import QueryObject
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.connectors.sqla.models import SqlaTable
+from superset.constants import CacheRegion
+from superset.dashboards.dao import DashboardDAO
+from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
+from superset.models.dashboard import Dashboard
+from superset.models.helpers import QueryResult
+from superset.models.slice import Slice
+from superset.utils.concurrency import copy_current_context
+from superset.utils.core import merge_extra_form_data_into_query
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardChartsDataCommand(BaseCommand):
+    """
+    Get the data of the charts of a dashboard in a single request.
+
+    The chart results are yielded one by one as soon as they are available: the
+    charts whose results are cached first, then the others as their queries, which
+    are run concurrently across all the charts, complete.
+    """
+
+    def __init__(
+        self,
+        id_or_slug: str,
+        charts: Optional[List[Dict[str, Any]]] = None,
+        extra_form_data: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+    ):
+        self._id_or_slug = id_or_slug
+        self._charts = charts
+        self._extra_form_data = extra_form_data or {}
+        self._force = force
+        self._dashboard: Optional[Dashboard] = None
+        self._datasets: List[SqlaTable] = []
+
+    def run(self) -> Iterator[Dict[str, Any]]:
+        if not self._dashboard:
+            self.validate()
+
+        slices = {chart.id: chart for chart in self._dashboard.slices}  # type: ignore
+        charts = (
+            self._charts
+            if self._charts is not None
+            else [{"id": chart_id} for chart_id in slices]
+        )
+        # the datasets are kept loaded, with their columns and metrics, in the
+        # session for the charts sharing them
+        self._datasets = SqlaTable.get_eager_sqlatable_datasources(
+            db.session,
+            {
+                chart.datasource_id
+                for chart in slices.values()
+                if chart.datasource_type == "table"
+            },
+        )
+
+        query_contexts: List[Tuple[int, QueryContext]] = []
+        chart_ids: Set[int] = set()
+        for chart in charts:
+            chart_id = chart["id"]
+            if chart_id in chart_ids:
+                continue
+            chart_ids.add(chart_id)
+            try:
+                if chart_id not in slices:
+                    raise ChartDataQueryFailedError(
+                        _("The chart is not part of the dashboard")
+                    )
+                query_context = self._create_query_context(
+                    slices[chart_id], chart.get("extra_form_data") or {}
+                )
+            except (
+                ChartDataQueryFailedError,
+                QueryObjectValidationError,
+                SupersetSecurityException,
+            ) as ex:
+                yield {"chart_id": chart_id, "error": ex.message}
+                continue
+            except ValidationError as ex:
+                yield {
+                    "chart_id": chart_id,
+                    "error": _(
+                        "Request is incorrect: %(error)s",
+                        error=ex.normalized_messages(),
+                    ),
+                }
+                continue
+            query_contexts.append((chart_id, query_context))
+
+        # the cached results of all the charts are loaded in a single round trip
+        query_caches = QueryCacheManager.get_many(
+            [
+                cache_key
+                for _chart_id, query_context in query_contexts
+                for cache_key in query_context.get_query_cache_keys().values()
+            ],
+            CacheRegion.DATA,
+            self._force,
+        )
+        for chart_id, query_context in query_contexts:
+            query_context.load_query_caches(query_caches=query_caches)
+
+        # the locks of the queries that are run ahead are held until their results
+        # are cached
+        with ExitStack() as single_flights:
+            cache_keys: Set[str] = set()
+            prepared: Dict[
+                int, List[Tuple[int, QueryObject, Callable[[], QueryResult]]]
+            ] = {}
+            for chart_id, query_context in query_contexts:
+                prepared[chart_id] = query_context.prepare_query_results(
+                    single_flights=single_flights, cache_keys=cache_keys
+                )
+
+            max_workers = max(current_app.config["CHART_DATA_MAX_WORKERS"], 1)
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="superset-query"
+            ) as executor:
+                futures: Dict[Future, Tuple[int, QueryObject]] = {
+                    executor.submit(copy_current_context(execute)): (
+                        chart_id,
+                        query_obj,
+                    )
+                    for chart_id, queries in prepared.items()
+                    for _idx, query_obj, execute in queries
+                }
+
+                # the cached charts are sent while the queries of the others run
+                for chart_id, query_context in query_contexts:
+                    if not prepared[chart_id]:
+                        yield self._get_chart_data(chart_id, query_context)
+
+                pending = {
+                    chart_id: len(queries)
+                    for chart_id, queries in prepared.items()
+                    if queries
+                }
+                query_context_by_chart = dict(query_contexts)
+                failed: Set[int] = set()
+                for future in as_completed(futures):
+                    chart_id, query_obj = futures[future]
+                    pending[chart_id] -= 1
+                    try:
+                        query_context_by_chart[chart_id].set_prefetched_result(
+                            query_obj, future.result()
+                        )
+                    except Exception as ex:  # pylint: disable=broad-except
+                        logger.warning("Failed to query chart %s: %s", chart_id, ex)
+                        if chart_id not in failed:
+                            failed.add(chart_id)
+                            yield {"chart_id": chart_id, "error": str(ex)}
+                    if not pending[chart_id] and chart_id not in failed:
+                        yield self._get_chart_data(
+                            chart_id, query_context_by_chart[chart_id]
+                        )
+
+    def validate(self) -> None:
+        self._dashboard = DashboardDAO.get_by_id_or_slug(self._id_or_slug)
+
+    def _create_query_context(
+        self, chart: Slice, extra_form_data: Dict[str, Any]
+    ) -> QueryContext:
+        try:
+            json_body = json.loads(chart.query_context)
+        except (TypeError, json.decoder.JSONDecodeError):
+            json_body = None
+        if not json_body:
+            raise ChartDataQueryFailedError(
+                _("Chart has no query context saved. Please save the chart again.")
+            )
+
+        json_body["result_format"] = ChartDataResultFormat.JSON
+        json_body["result_type"] = ChartDataResultType.FULL
+        json_body["force"] = self._force
+        for query in json_body.get("queries") or []:
+            merge_extra_form_data_into_query(query, self._extra_form_data)
+            merge_extra_form_data_into_query(query, extra_form_data)
+
+        try:
+            query_context = ChartDataQueryContextSchema().load(json_body)
+        except KeyError as ex:
+            raise ValidationError("Request is incorrect") from ex
+        ChartDataCommand(query_context).validate()
+        return query_context
+
+    @staticmethod
+    def _get_chart_data(chart_id: int, query_context: QueryContext) -> Dict[str, Any]:
+        try:
+            result = ChartDataCommand(query_context).run()
+        except ChartDataQueryFailedError as ex:
+            return {"chart_id": chart_id, "error": ex.message}
+        return {"chart_id": chart_id, "result": result["queries"]}
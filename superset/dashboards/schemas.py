@@ -298,6 +298,28 @@ class GetFavStarIdsSchema(Schema):
     )
 
 
+class DashboardChartDataSchema(Schema):
+    id = fields.Integer(required=True, description="The id of the chart")
+    extra_form_data = fields.Dict(
+        description="The extra form data applying to the chart, eg the state of the "
+        "native filters in its scope",
+    )
+
+
+class DashboardChartsDataSchema(Schema):
+    charts = fields.List(
+        fields.Nested(DashboardChartDataSchema),
+        description="The charts to get the data of, all the charts of the dashboard "
+        "by default",
+    )
+    extra_form_data = fields.Dict(
+        description="The extra form data applying to all the charts",
+    )
+    force = fields.Boolean(
+        description="Should the queries be forced to load from the source",
+    )
+
+
 class ImportV1DashboardSchema(Schema):
     dashboard_title = fields.String(required=True)
     description = fields.String(allow_none=True)
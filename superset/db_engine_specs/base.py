@@ -37,6 +37,7 @@ from typing import (
 )
 
 import pandas as pd
+import pyarrow as pa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -318,6 +319,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # If True, then it will allow  in subquery ,
     # if False it will allow as regular CTE
     allows_cte_in_subquery = True
+    # Whether several columns can be compared at once to a list of tuples, i.e.
+    # ``(a, b) IN ((1, 2), (3, 4))``, which is used to filter the top groups of
+    # series limited queries on databases that don't support joins
+    allows_tuple_in = False
     # Whether allow LIMIT clause in the SQL
     # If True, then the database engine is allowed for LIMIT clause
     # If False, then the database engine is allowed for TOP clause
@@ -334,6 +339,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     max_column_name_length = 0
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
+    # Whether connections can be kept in a pool shared by the threads of a process
+    # (see ``ENGINE_POOL_ENABLED``); embedded engines bind connections to a thread
+    # or hold a lock on their file, so they always use a fresh connection
+    allows_connection_pooling = True
     custom_errors: Dict[
         Pattern[str], Tuple[str, SupersetErrorType, Dict[str, Any]]
     ] = {}
@@ -563,6 +572,22 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex)
 
+    @classmethod
+    def fetch_arrow(  # pylint: disable=unused-argument
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        """
+        Fetch the results of a query as an Arrow table, for drivers that can return
+        columnar data natively. This skips building a Python object per value, and
+        the table is used as is by ``SupersetResultSet``.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or None if the cursor can't return Arrow data and
+            ``fetch_data`` should be used instead
+        """
+        return None
+
     @classmethod
     def expand_data(
         cls, columns: List[ResultSetColumnType], data: List[Dict[Any, Any]]
@@ -622,6 +647,19 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             return type_code.upper()
         return None
 
+    @classmethod
+    def get_arrow_type(  # pylint: disable=unused-argument
+        cls, type_code: Any
+    ) -> Optional[pa.DataType]:
+        """
+        Map a column type code from the cursor description to the Arrow type of its
+        values, so that the type doesn't need to be inferred from the data.
+
+        :param type_code: Type code from cursor description
+        :return: The Arrow type, or None to infer it from the values
+        """
+        return None
+
     @classmethod
     def normalize_indexes(cls, indexes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
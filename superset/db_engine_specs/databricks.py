@@ -18,6 +18,8 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import pyarrow as pa
+
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.hive import HiveEngineSpec
 
@@ -71,3 +73,16 @@ class DatabricksNativeEngineSpec(DatabricksODBCEngineSpec):
     engine = "databricks"
     engine_name = "Databricks Native Connector"
     driver = "connector"
+
+    @classmethod
+    def fetch_arrow(
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        if not cursor.description or not hasattr(cursor, "fetchall_arrow"):
+            return None
+        try:
+            if limit:
+                return cursor.fetchmany_arrow(limit)
+            return cursor.fetchall_arrow()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex)
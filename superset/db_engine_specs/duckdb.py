@@ -20,6 +20,7 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Pattern, Tuple, TYPE_CHECKING
 
+import pyarrow as pa
 from flask_babel import gettext as __
 from sqlalchemy.engine.reflection import Inspector
 
@@ -38,6 +39,7 @@ COLUMN_DOES_NOT_EXIST_REGEX = re.compile("no such column: (?P<column_name>.+)")
 class DuckDBEngineSpec(BaseEngineSpec):
     engine = "duckdb"
     engine_name = "DuckDB"
+    allows_connection_pooling = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -72,6 +74,18 @@ class DuckDBEngineSpec(BaseEngineSpec):
             return f"""'{dttm.isoformat(sep=" ", timespec="microseconds")}'"""
         return None
 
+    @classmethod
+    def fetch_arrow(
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        if not hasattr(cursor, "fetch_arrow_table"):
+            return None
+        try:
+            table = cursor.fetch_arrow_table()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex)
+        return table.slice(0, limit) if limit else table
+
     @classmethod
     def get_table_names(
         cls, database: Database, inspector: Inspector, schema: Optional[str]
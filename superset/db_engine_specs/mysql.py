@@ -66,6 +66,7 @@ class MySQLEngineSpec(BaseEngineSpec, BasicParametersMixin):
     engine = "mysql"
     engine_name = "MySQL"
     max_column_name_length = 64
+    allows_tuple_in = True
 
     default_driver = "mysqldb"
     sqlalchemy_uri_placeholder = (
@@ -20,6 +20,7 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Pattern, Tuple, TYPE_CHECKING
 
+import pyarrow as pa
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
@@ -74,6 +75,20 @@ COLUMN_DOES_NOT_EXIST_REGEX = re.compile(
 
 SYNTAX_ERROR_REGEX = re.compile('syntax error at or near "(?P<syntax_error>.*?)"')
 
+# Arrow types of the values returned by psycopg2, by type OID; these are the types
+# Arrow infers for them, other types are still inferred from the values
+ARROW_TYPES_BY_OID = {
+    16: pa.bool_(),  # bool
+    20: pa.int64(),  # int8
+    21: pa.int64(),  # int2
+    23: pa.int64(),  # int4
+    25: pa.string(),  # text
+    700: pa.float64(),  # float4
+    701: pa.float64(),  # float8
+    1042: pa.string(),  # bpchar
+    1043: pa.string(),  # varchar
+}
+
 
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
@@ -162,6 +177,10 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "(timestamp 'epoch' + {col} * interval '1 second')"
 
+    @classmethod
+    def get_arrow_type(cls, type_code: Any) -> Optional[pa.DataType]:
+        return ARROW_TYPES_BY_OID.get(type_code)
+
 
 class PostgresEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
     engine = "postgresql"
@@ -176,6 +195,7 @@ class PostgresEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
 
     max_column_name_length = 63
     try_remove_schema_from_table_name = False
+    allows_tuple_in = True
 
     column_type_mappings = (
         (
@@ -20,6 +20,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Pattern, Tuple, TYPE_CHECKING
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -130,6 +131,27 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
     def epoch_ms_to_dttm(cls) -> str:
         return "DATEADD(MS, {col}, '1970-01-01')"
 
+    @classmethod
+    def fetch_arrow(
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        if not cursor.description or not hasattr(cursor, "fetch_arrow_all"):
+            return None
+        try:
+            table = cursor.fetch_arrow_all()
+        except NotSupportedError:
+            # the result set was returned as JSON, not Arrow
+            return None
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex)
+        if table is None:
+            # no rows were returned
+            return None
+        return table.slice(0, limit) if limit else table
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: Optional[Dict[str, Any]] = None
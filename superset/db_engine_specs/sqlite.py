@@ -36,6 +36,7 @@ COLUMN_DOES_NOT_EXIST_REGEX = re.compile("no such column: (?P<column_name>.+)")
 class SqliteEngineSpec(BaseEngineSpec):
     engine = "sqlite"
     engine_name = "SQLite"
+    allows_connection_pooling = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -30,8 +30,11 @@ from werkzeug.local import LocalProxy
 
 from superset.utils.async_query_manager import AsyncQueryManager
 from superset.utils.cache_manager import CacheManager
+from superset.utils.compiled_query_cache import CompiledQueryCache
 from superset.utils.encrypt import EncryptedFieldFactory
+from superset.utils.engine_manager import EngineManager
 from superset.utils.feature_flag_manager import FeatureFlagManager
+from superset.utils.local_data_cache import LocalDataCache
 from superset.utils.machine_auth import MachineAuthProviderFactory
 from superset.utils.profiler import SupersetProfiler
 
@@ -114,12 +117,15 @@ appbuilder = AppBuilder(update_perms=False)
 async_query_manager = AsyncQueryManager()
 cache_manager = CacheManager()
 celery_app = celery.Celery()
+compiled_query_cache = CompiledQueryCache()
 csrf = CSRFProtect()
 db = SQLA()
 _event_logger: Dict[str, Any] = {}
 encrypted_field_factory = EncryptedFieldFactory()
+engine_manager = EngineManager()
 event_logger = LocalProxy(lambda: _event_logger.get("event_logger"))
 feature_flag_manager = FeatureFlagManager()
+local_data_cache = LocalDataCache()
 machine_auth_provider_factory = MachineAuthProviderFactory()
 manifest_processor = UIManifestProcessor(APP_DIR)
 migrate = Migrate()
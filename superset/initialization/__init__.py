@@ -36,10 +36,13 @@ from superset.extensions import (
     async_query_manager,
     cache_manager,
     celery_app,
+    compiled_query_cache,
     csrf,
     db,
     encrypted_field_factory,
+    engine_manager,
     feature_flag_manager,
+    local_data_cache,
     machine_auth_provider_factory,
     manifest_processor,
     migrate,
@@ -456,6 +459,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_wtf()
         self.configure_middlewares()
         self.configure_cache()
+        self.configure_engine_manager()
+        self.configure_compiled_query_cache()
+        self.configure_local_data_cache()
 
         with self.superset_app.app_context():
             self.init_app_in_ctx()
@@ -484,6 +490,15 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         cache_manager.init_app(self.superset_app)
         results_backend_manager.init_app(self.superset_app)
 
+    def configure_engine_manager(self) -> None:
+        engine_manager.init_app(self.superset_app)
+
+    def configure_compiled_query_cache(self) -> None:
+        compiled_query_cache.init_app(self.superset_app)
+
+    def configure_local_data_cache(self) -> None:
+        local_data_cache.init_app(self.superset_app, cache_manager.data_cache)
+
     def configure_feature_flags(self) -> None:
         feature_flag_manager.init_app(self.superset_app)
 
@@ -24,7 +24,7 @@ from ast import literal_eval
 from contextlib import closing
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
 import numpy
 import pandas as pd
@@ -48,7 +48,7 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import ArgumentError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapper, relationship
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import expression, Select
@@ -56,10 +56,15 @@ from sqlalchemy.sql import expression, Select
 from superset import app, db_engine_specs, is_feature_enabled
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import TimeGrain
-from superset.extensions import cache_manager, encrypted_field_factory, security_manager
+from superset.extensions import (
+    cache_manager,
+    encrypted_field_factory,
+    engine_manager,
+    security_manager,
+)
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.models.tags import FavStarUpdater
-from superset.result_set import SupersetResultSet
+from superset.result_set import dedup, SupersetResultSet
 from superset.utils import cache as cache_util, core as utils
 from superset.utils.core import get_username
 from superset.utils.memoized import memoized
@@ -368,7 +373,14 @@ class Database(
         logger.debug("Database.get_sqla_engine(). Masked URL: %s", str(masked_url))
 
         params = extra.get("engine_params", {})
-        if nullpool:
+        # pooled engines are shared across requests, so they can only be used for
+        # databases that have been persisted and whose driver allows it
+        pooled = (
+            engine_manager.enabled
+            and self.id is not None
+            and self.db_engine_spec.allows_connection_pooling
+        )
+        if nullpool and not pooled:
             params["poolclass"] = NullPool
 
         connect_args = params.get("connect_args", {})
@@ -396,6 +408,8 @@ class Database(
             )
 
         try:
+            if pooled:
+                return engine_manager.get_engine(self.id, sqlalchemy_url, params)
             return create_engine(sqlalchemy_url, **params)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
@@ -424,28 +438,20 @@ class Database(
                 and isinstance(df_series[0], (list, dict))
             )
 
-        def _log_query(sql: str) -> None:
-            if log_query:
-                log_query(
-                    engine.url,
-                    sql,
-                    schema,
-                    get_username(),
-                    __name__,
-                    security_manager,
-                )
-
         with closing(engine.raw_connection()) as conn:
             cursor = conn.cursor()
             for sql_ in sqls[:-1]:
-                _log_query(sql_)
+                self._log_query(engine, sql_, schema)
                 self.db_engine_spec.execute(cursor, sql_)
                 cursor.fetchall()
 
-            _log_query(sqls[-1])
+            self._log_query(engine, sqls[-1], schema)
             self.db_engine_spec.execute(cursor, sqls[-1])
 
-            data = self.db_engine_spec.fetch_data(cursor)
+            table = self.db_engine_spec.fetch_arrow(cursor)
+            data = (
+                table if table is not None else self.db_engine_spec.fetch_data(cursor)
+            )
             result_set = SupersetResultSet(
                 data, cursor.description, self.db_engine_spec
             )
@@ -459,6 +465,72 @@ class Database(
 
             return df
 
+    def iter_df(
+        self,
+        sql: str,
+        schema: Optional[str] = None,
+        chunk_size: int = 10000,
+        limit: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query and yield its results as dataframes of up to ``chunk_size`` rows,
+        fetched from the cursor as they are consumed, so that the whole result set
+        is never held in memory.
+
+        :param sql: The SQL to run, the results of the last statement are returned
+        :param schema: The schema to run the query in
+        :param chunk_size: The maximum number of rows of each dataframe
+        :param limit: The maximum number of rows to return
+        :returns: An iterator of dataframes, the first one is yielded even if the
+            query returns no rows
+        """
+        sqls = self.db_engine_spec.parse_sql(sql)
+        engine = self.get_sqla_engine(schema)
+
+        with closing(engine.raw_connection()) as conn:
+            cursor = conn.cursor()
+            for sql_ in sqls[:-1]:
+                self._log_query(engine, sql_, schema)
+                self.db_engine_spec.execute(cursor, sql_)
+                cursor.fetchall()
+
+            self._log_query(engine, sqls[-1], schema)
+            self.db_engine_spec.execute(cursor, sqls[-1])
+
+            columns = dedup([col[0] for col in cursor.description or []])
+            remaining = limit
+            first = True
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                try:
+                    data = cursor.fetchmany(size) if cursor.description else []
+                except Exception as ex:
+                    raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
+                if not data:
+                    break
+
+                result_set = SupersetResultSet(
+                    data, cursor.description, self.db_engine_spec
+                )
+                yield result_set.to_pandas_df()
+                first = False
+                if remaining is not None:
+                    remaining -= len(data)
+
+            if first:
+                yield pd.DataFrame(columns=columns)
+
+    def _log_query(self, engine: Engine, sql: str, schema: Optional[str]) -> None:
+        if log_query:
+            log_query(
+                engine.url,
+                sql,
+                schema,
+                get_username(),
+                __name__,
+                security_manager,
+            )
+
     def compile_sqla_query(self, qry: Select, schema: Optional[str] = None) -> str:
         engine = self.get_sqla_engine(schema=schema)
 
@@ -794,8 +866,16 @@ class Database(
         return sqla_url.get_dialect()()
 
 
+def invalidate_engines(
+    _mapper: Mapper, _connection: Connection, target: Database
+) -> None:
+    engine_manager.invalidate(target.id)
+
+
 sqla.event.listen(Database, "after_insert", security_manager.set_perm)
 sqla.event.listen(Database, "after_update", security_manager.set_perm)
+sqla.event.listen(Database, "after_update", invalidate_engines)
+sqla.event.listen(Database, "after_delete", invalidate_engines)
 
 
 class Log(Model):  # pylint: disable=too-few-public-methods
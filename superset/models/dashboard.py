@@ -60,7 +60,7 @@ from superset.models.user_attributes import UserAttribute
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.utils import core as utils
 from superset.utils.decorators import debounce
-from superset.utils.hashing import md5_sha_from_str
+from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
 from superset.utils.urls import get_url_path
 
 metadata = Model.metadata  # pylint: disable=no-member
@@ -303,16 +303,88 @@ class Dashboard(Model, AuditMixinNullable, ImportExportMixin):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: List[Dict[str, Any]] = []
-
+        slices_by_model: Dict[
+            Type["BaseDatasource"], Dict[int, Set[Slice]]
+        ] = defaultdict(dict)
         for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
+            slices_by_model[cls_model][datasource_id] = slices
+
+        data_by_datasource: Dict[Tuple[Type["BaseDatasource"], int], Any] = {}
+        for cls_model, slices_by_id in slices_by_model.items():
+            if cls_model is SqlaTable:
+                data_by_id = self._get_datasets_trimmed_for_slices(slices_by_id)
+            else:
+                data_by_id = {
+                    datasource.id: datasource.data_for_slices(
+                        slices_by_id[datasource.id]
+                    )
+                    for datasource in db.session.query(cls_model).filter(
+                        cls_model.id.in_(slices_by_id)
+                    )
+                }
+            for datasource_id, data in data_by_id.items():
+                data_by_datasource[(cls_model, datasource_id)] = data
+
+        return [
+            data_by_datasource[key]
+            for key in slices_by_datasource
+            if key in data_by_datasource
+        ]
+
+    @staticmethod
+    def _get_datasets_trimmed_for_slices(
+        slices_by_id: Dict[int, Set[Slice]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Return the payloads of datasets trimmed for the charts that use them.
+
+        The payloads are cached per dataset, keyed by the version of the dataset and
+        of its charts, so that only the datasets that changed since they were last
+        loaded are queried, with their columns, metrics, owners and database, in
+        bulk.
+
+        :param slices_by_id: The mapping of dataset ids to the charts that use them
+        :returns: The mapping of the ids of the existing datasets to their payload
+        """
+        versions = SqlaTable.get_versions(db.session, slices_by_id)
+        cache_keys = {
+            datasource_id: "dashboard_dataset__"
+            + md5_sha_from_dict(
+                {
+                    "version": version,
+                    "slices": sorted(
+                        [slc.id, str(slc.changed_on)]
+                        for slc in slices_by_id[datasource_id]
+                    ),
+                }
             )
+            for datasource_id, version in versions.items()
+        }
+        cached_values = cache_manager.cache.get_many(*cache_keys.values())
+        result = {
+            datasource_id: value
+            for datasource_id, value in zip(cache_keys, cached_values)
+            if value is not None
+        }
 
-            if datasource:
+        missing_ids = [
+            datasource_id for datasource_id in cache_keys if datasource_id not in result
+        ]
+        if missing_ids:
+            for datasource in SqlaTable.get_eager_sqlatable_datasources(
+                db.session, missing_ids
+            ):
                 # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+                result[datasource.id] = datasource.data_for_slices(
+                    slices_by_id[datasource.id]
+                )
+            cache_manager.cache.set_many(
+                {
+                    cache_keys[datasource_id]: result[datasource_id]
+                    for datasource_id in missing_ids
+                    if datasource_id in result
+                }
+            )
 
         return result
 
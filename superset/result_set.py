@@ -19,9 +19,8 @@
 import datetime
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
-import numpy as np
 import pandas as pd
 import pyarrow as pa
 
@@ -31,6 +30,14 @@ from superset.utils import core as utils
 
 logger = logging.getLogger(__name__)
 
+PA_CONVERSION_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    TypeError,  # this is super hackey,
+    # https://issues.apache.org/jira/browse/ARROW-7855
+)
+
 
 def dedup(l: List[str], suffix: str = "__", case_sensitive: bool = True) -> List[str]:
     """De-duplicates a list of string by suffixing a counter
@@ -58,13 +65,17 @@ def dedup(l: List[str], suffix: str = "__", case_sensitive: bool = True) -> List
     return new_l
 
 
+# reuse a single encoder, ``json.dumps`` builds a new one on every call when
+# ``default`` is set
+json_encoder = json.JSONEncoder(default=utils.json_iso_dttm_ser)
+
+
 def stringify(obj: Any) -> str:
-    return json.dumps(obj, default=utils.json_iso_dttm_ser)
+    return json_encoder.encode(obj)
 
 
-def stringify_values(array: np.ndarray) -> np.ndarray:
-    vstringify = np.vectorize(stringify)
-    return vstringify(array)
+def stringify_values(values: Sequence[Any]) -> List[str]:
+    return [stringify(value) for value in values]
 
 
 def destringify(obj: str) -> Any:
@@ -87,17 +98,14 @@ def convert_to_string(value: Any) -> str:
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals
         self,
-        data: DbapiResult,
+        data: Union[DbapiResult, pa.Table],
         cursor_description: DbapiDescription,
         db_engine_spec: Type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: List[str] = []
-        pa_data: List[pa.Array] = []
+        pa_data: List[Union[pa.Array, pa.ChunkedArray]] = []
         deduped_cursor_desc: List[Tuple[Any, ...]] = []
-        numpy_dtype: List[Tuple[str, ...]] = []
-        stringified_arr: np.ndarray
 
         if cursor_description:
             # get deduped list of column names
@@ -111,55 +119,31 @@ class SupersetResultSet:
                 for column_name, description in zip(column_names, cursor_description)
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(
-                                    array[column], dtype="datetime64[ns]"
-                                )
-                                series = pd.to_datetime(series).dt.tz_localize(tz)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series, type=pa.timestamp("ns", tz=tz)
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            # columnar data fetched natively from the driver, only the types that
+            # Superset doesn't support as such need to be converted
+            column_names = column_names or dedup(data.column_names)
+            pa_data = [
+                pa.array(stringify_values(column.to_pylist()))
+                if pa.types.is_nested(column.type)
+                else column
+                for column in data.columns
+            ]
+        elif data:
+            # transpose the rows into columns in a single pass, so that each column
+            # can be converted to Arrow independently
+            arrow_types = [
+                db_engine_spec.get_arrow_type(description[1])
+                if len(description) > 1
+                else None
+                for description in deduped_cursor_desc
+            ]
+            for i, values in enumerate(zip(*data)):
+                pa_data.append(
+                    self.convert_to_pa_array(
+                        values, arrow_types[i] if i < len(arrow_types) else None
+                    )
+                )
 
         self.table = pa.Table.from_arrays(pa_data, names=column_names)
         self._type_dict: Dict[str, Any] = {}
@@ -173,6 +157,57 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def convert_to_pa_array(
+        cls, values: Sequence[Any], pa_type: Optional[pa.DataType] = None
+    ) -> pa.Array:
+        """
+        Convert the values of a column to an Arrow array.
+
+        Values that can't be represented in Arrow, or that are nested, are
+        serialized as JSON strings.
+
+        :param values: The values of the column
+        :param pa_type: The Arrow type of the column, when known upfront
+        :return: The Arrow array
+        """
+        if pa_type is not None:
+            try:
+                return pa.array(values, type=pa_type)
+            except PA_CONVERSION_ERRORS:
+                pass
+
+        try:
+            array = pa.array(values)
+        except PA_CONVERSION_ERRORS:
+            # attempt serialization of values as strings
+            return pa.array(stringify_values(values))
+
+        if pa.types.is_nested(array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return pa.array(stringify_values(values))
+
+        if pa.types.is_temporal(array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = cls.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(values, dtype="datetime64[ns]")
+                        series = pd.to_datetime(series).dt.tz_localize(tz)
+                        return pa.Array.from_pandas(
+                            series, type=pa.timestamp("ns", tz=tz)
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -195,7 +230,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: List[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -0,0 +1,163 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Memoization of the security lookups that query the metadata database, eg, the row
+level security filters of a table or the permissions of the user, which are repeated
+many times while serving a single request.
+
+The lookups are memoized for the duration of the request, and, when
+``SECURITY_CACHE_TIMEOUT`` is set, in the default cache for that many seconds across
+requests. Any change to the roles, permissions or row level security filters
+invalidates them.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from flask import current_app, g, has_app_context
+from flask_appbuilder.security.sqla.models import (
+    Permission,
+    PermissionView,
+    Role,
+    User,
+    ViewMenu,
+)
+from flask_login import AnonymousUserMixin
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from superset.extensions import cache_manager
+from superset.utils.hashing import md5_sha_from_str
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+GENERATION_CACHE_KEY = "security_cache_generation"
+
+# bumped on changes made by this process, to invalidate the lookups memoized by the
+# current request
+_local_generation = 0
+
+
+def get_user_cache_id(user: Any) -> Optional[str]:
+    """
+    Returns how the user is identified in the cache, or None if the lookups of the
+    user can't be memoized, eg, for guest users whose roles come from their token.
+    """
+    if getattr(user, "is_guest_user", False):
+        return None
+    if isinstance(user, AnonymousUserMixin) or user.is_anonymous:
+        return "anonymous"
+    return str(user.id) if getattr(user, "id", None) else None
+
+
+def _incr(stat: str) -> None:
+    current_app.config["STATS_LOGGER"].incr(f"security_cache.{stat}")
+
+
+def _get_shared_generation(memo: Dict[Hashable, Any]) -> str:
+    # read once per request
+    key = ("generation", _local_generation)
+    if key not in memo:
+        memo[key] = cache_manager.cache.get(GENERATION_CACHE_KEY) or "0"
+    return memo[key]
+
+
+def memoize(
+    name: str,
+    user: Any,
+    args: Tuple[Hashable, ...],
+    load: Callable[[], T],
+) -> T:
+    """
+    Returns the result of a security lookup of the user, loading it only if it's not
+    memoized already.
+
+    :param name: The name of the lookup
+    :param user: The user the lookup is made for
+    :param args: The arguments of the lookup, besides the user
+    :param load: Runs the lookup
+    :returns: The result of the lookup, which is pickled when it's cached across
+        requests
+    """
+    user_cache_id = get_user_cache_id(user) if user is not None else None
+    if user_cache_id is None or not has_app_context():
+        return load()
+
+    # pylint: disable=assigning-non-slot
+    memo: Optional[Dict[Hashable, Any]] = getattr(g, "_security_cache", None)
+    if memo is None:
+        memo = g._security_cache = {}
+
+    request_key = (_local_generation, name, user_cache_id, args)
+    if request_key in memo:
+        _incr("request_hit")
+        return memo[request_key]
+
+    timeout = current_app.config["SECURITY_CACHE_TIMEOUT"]
+    if timeout:
+        args_hash = md5_sha_from_str(repr(args))
+        generation = _get_shared_generation(memo)
+        cache_key = f"security:{generation}:{name}:{user_cache_id}:{args_hash}"
+        cached = cache_manager.cache.get(cache_key)
+        if cached is not None:
+            _incr("shared_hit")
+            memo[request_key] = cached[0]
+            return cached[0]
+
+    _incr("miss")
+    value = load()
+    memo[request_key] = value
+    if timeout:
+        # wrapped, so that falsy values are cached as well
+        cache_manager.cache.set(cache_key, (value,), timeout=timeout)
+    return value
+
+
+def invalidate() -> None:
+    """
+    Invalidate the memoized lookups, of every request and process.
+    """
+    global _local_generation  # pylint: disable=global-statement
+    _local_generation += 1
+    if has_app_context() and current_app.config["SECURITY_CACHE_TIMEOUT"]:
+        cache_manager.cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=0)
+
+
+def _is_security_change(obj: Any) -> bool:
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+
+    if isinstance(obj, User):
+        # eg, the last login of the user is not a change
+        return inspect(obj).attrs.roles.history.has_changes()
+    return isinstance(
+        obj, (Role, Permission, PermissionView, ViewMenu, RowLevelSecurityFilter)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def invalidate_on_change(  # pylint: disable=unused-argument
+    session: Session, flush_context: Any
+) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if _is_security_change(obj):
+            invalidate()
+            return
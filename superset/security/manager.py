@@ -58,9 +58,9 @@ from sqlalchemy import and_, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 
 from superset import sql_parse
+from superset.security import cache as security_cache
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
@@ -95,6 +95,12 @@ class DatabaseAndSchema(NamedTuple):
     schema: str
 
 
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -291,8 +297,18 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         user = g.user
         if user.is_anonymous:
-            return self.is_item_public(permission_name, view_name)
-        return self._has_view_access(user, permission_name, view_name)
+            return security_cache.memoize(
+                "can_access",
+                user,
+                (permission_name, view_name),
+                lambda: self.is_item_public(permission_name, view_name),
+            )
+        return security_cache.memoize(
+            "can_access",
+            user,
+            (permission_name, view_name),
+            lambda: self._has_view_access(user, permission_name, view_name),
+        )
 
     def can_access_all_queries(self) -> bool:
         """
@@ -516,6 +532,14 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> Set[str]:
+        return security_cache.memoize(
+            "user_view_menu_names",
+            g.user,
+            (permission_name,),
+            lambda: self._user_view_menu_names(permission_name),
+        )
+
+    def _user_view_menu_names(self, permission_name: str) -> Set[str]:
         base_query = (
             self.get_session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -1128,6 +1152,16 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return [self.get_public_role()] if public_role else []
         return user.roles
 
+    def get_user_role_ids(self, user: Optional[User] = None) -> List[int]:
+        if not user:
+            user = g.user
+        return security_cache.memoize(
+            "role_ids",
+            user,
+            (),
+            lambda: [role.id for role in self.get_user_roles(user)],
+        )
+
     def get_guest_rls_filters(
         self, dataset: "BaseDatasource"
     ) -> List[GuestTokenRlsRule]:
@@ -1151,7 +1185,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         self,
         table: "BaseDatasource",
         username: Optional[str] = None,
-    ) -> List[SqlaQuery]:
+    ) -> List[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
@@ -1168,6 +1202,14 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         else:
             return []
 
+        return security_cache.memoize(
+            "rls_filters",
+            user,
+            (table.id,),
+            lambda: self._get_rls_filters(table, user),
+        )
+
+    def _get_rls_filters(self, table: "BaseDatasource", user: User) -> List[RLSFilter]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -1175,7 +1217,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(user)]
+        user_roles = self.get_user_role_ids(user)
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -1225,7 +1267,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilter(*row) for row in query.all()]
 
     def get_rls_ids(self, table: "BaseDatasource") -> List[int]:
         """
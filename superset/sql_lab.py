@@ -280,7 +280,12 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
                 query.id,
                 str(query.to_dict()),
             )
-            data = db_engine_spec.fetch_data(cursor, increased_limit)
+            table = db_engine_spec.fetch_arrow(cursor, increased_limit)
+            data: Union[pa.Table, List[Tuple[Any, ...]]] = (
+                table
+                if table is not None
+                else db_engine_spec.fetch_data(cursor, increased_limit)
+            )
             if query.limit is None or len(data) <= query.limit:
                 query.limiting_factor = LimitingFactor.NOT_LIMITED
             else:
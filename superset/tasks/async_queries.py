@@ -18,13 +18,15 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import Any, cast, Dict, Optional, TYPE_CHECKING
+from typing import Any, cast, Dict, List, Optional, TYPE_CHECKING
 
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app, g
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
 from superset.exceptions import SupersetVizException
 from superset.extensions import (
     async_query_manager,
@@ -102,6 +104,31 @@ def load_chart_data_into_cache(
         raise ex
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    user_id: Optional[int],
+    form_data: Dict[str, Any],
+    cache_keys: List[str],
+) -> None:
+    """
+    Refresh the stale cached results of a chart, which are served in the meantime.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.data.commands.get_data_command import ChartDataCommand
+
+    try:
+        ensure_user_is_set(user_id)
+        set_form_data(form_data)
+        query_context = _create_query_context_from_form({**form_data, "force": True})
+        ChartDataCommand(query_context).run()
+    except SoftTimeLimitExceeded as ex:
+        logger.warning("A timeout occurred while refreshing chart data, error: %s", ex)
+        raise ex
+    finally:
+        for cache_key in cache_keys:
+            QueryCacheManager.release_refresh(cache_key, CacheRegion.DATA)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: Dict[str, Any],
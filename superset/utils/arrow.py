@@ -0,0 +1,66 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+""" Helpers for (de)serializing dataframes as Arrow IPC streams.
+"""
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+
+def can_serialize_df(df: pd.DataFrame) -> bool:
+    """
+    Whether a dataframe can be serialized to Arrow without altering it.
+
+    Arrow requires unique string column names; nested column indexes (eg, the
+    output of a pivot that wasn't flattened) are kept as they are.
+    """
+    return df.columns.is_unique and all(isinstance(col, str) for col in df.columns)
+
+
+def df_to_arrow_ipc(df: pd.DataFrame, compression: Optional[str] = None) -> bytes:
+    """
+    Serialize a dataframe as an Arrow IPC stream.
+
+    The pandas metadata (index, dtypes) is stored in the schema, so that the
+    dataframe can be rebuilt by ``arrow_ipc_to_df``.
+
+    :param df: The dataframe to serialize
+    :param compression: The buffer compression codec, ``lz4`` or ``zstd``
+    :returns: The IPC stream
+    :raises pa.ArrowException: If a column can't be converted to Arrow
+    """
+    table = pa.Table.from_pandas(df)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_ipc_to_df(payload: bytes) -> pd.DataFrame:
+    """
+    Deserialize a dataframe from an Arrow IPC stream.
+
+    Buffers are read in place, compressed streams are detected from the stream
+    itself.
+
+    :param payload: The IPC stream, as written by ``df_to_arrow_ipc``
+    :returns: The dataframe
+    """
+    table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    return table.to_pandas(integer_object_nulls=True)
@@ -20,7 +20,16 @@ import inspect
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Union,
+)
 
 from flask import current_app as app, request
 from flask_caching import Cache
@@ -28,7 +37,7 @@ from flask_caching.backends import NullCache
 from werkzeug.wrappers.etag import ETagResponseMixin
 
 from superset import db
-from superset.extensions import cache_manager
+from superset.extensions import cache_manager, local_data_cache
 from superset.models.cache import CacheKey
 from superset.utils.core import json_int_dttm_ser
 from superset.utils.hashing import md5_sha_from_dict
@@ -52,9 +61,15 @@ def set_and_log_cache(
     cache_value: Dict[str, Any],
     cache_timeout: Optional[int] = None,
     datasource_uid: Optional[str] = None,
-) -> None:
+    cache_tags: Optional[Iterable[str]] = None,
+) -> Optional[str]:
+    """
+    Cache a value along with the time it was cached, and index its key.
+
+    :returns: The time the value was cached, or None if it wasn't
+    """
     if isinstance(cache_instance.cache, NullCache):
-        return
+        return None
 
     timeout = (
         cache_timeout
@@ -74,11 +89,108 @@ def set_and_log_cache(
                 datasource_uid=datasource_uid,
             )
             db.session.add(ck)
+
+        if config["CACHE_INVALIDATION_INDEX_ENABLED"]:
+            tags = [datasource_uid] if datasource_uid else []
+            tags.extend(cache_tags or [])
+            tag_cache_key(cache_instance, cache_key, tags, timeout)
     except Exception as ex:  # pylint: disable=broad-except
         # cache.set call can fail if the backend is down or if
         # the key is too large or whatever other reasons
         logger.warning("Could not cache key %s", cache_key)
         logger.exception(ex)
+        return None
+    return dttm
+
+
+def database_cache_tag(database_id: int) -> str:
+    return f"database__{database_id}"
+
+
+def chart_cache_tag(chart_id: int) -> str:
+    return f"chart__{chart_id}"
+
+
+def _cache_tag_key(tag: str) -> str:
+    return f"cache_tag__{tag}"
+
+
+def tag_cache_key(
+    cache_instance: Cache,
+    cache_key: str,
+    tags: Iterable[str],
+    timeout: int,
+) -> None:
+    """
+    Add the cache key to the invalidation index of the tags, which is stored in the
+    cache backend and outlives the keys it holds.
+
+    With Redis, the index of a tag is a native set, updated atomically. Other backends
+    store it as a regular value, updated on a best effort basis.
+    """
+    backend = cache_instance.cache
+    client = getattr(backend, "_write_client", None)
+    if client is None:
+        for tag in tags:
+            index_key = _cache_tag_key(tag)
+            cache_keys = cache_instance.get(index_key) or set()
+            cache_keys.add(cache_key)
+            cache_instance.set(index_key, cache_keys, timeout=timeout)
+        return
+
+    # pylint: disable=protected-access
+    names = [backend._get_prefix() + _cache_tag_key(tag) for tag in tags]
+    pipe = client.pipeline()
+    for name in names:
+        pipe.ttl(name)
+        pipe.sadd(name, cache_key)
+    ttls = pipe.execute()[::2]
+    for name, ttl in zip(names, ttls):
+        if timeout == 0:
+            pipe.persist(name)
+        # only ever extend the lifetime of the index, -1 means it has none and -2
+        # that it didn't exist
+        elif ttl == -2 or 0 <= ttl < timeout:
+            pipe.expire(name, timeout)
+    pipe.execute()
+
+
+def get_tagged_cache_keys(cache_instance: Cache, tag: str) -> Set[str]:
+    backend = cache_instance.cache
+    client = getattr(backend, "_write_client", None)
+    if client is None:
+        return set(cache_instance.get(_cache_tag_key(tag)) or set())
+
+    # pylint: disable=protected-access
+    members = client.smembers(backend._get_prefix() + _cache_tag_key(tag))
+    return {member.decode() for member in members}
+
+
+def invalidate_cache_tags(cache_instance: Cache, tags: Iterable[str]) -> int:
+    """
+    Delete the cached values tagged with any of the tags, along with their index.
+
+    :returns: The number of cache keys that were deleted
+    """
+    tags = list(tags)
+    if not tags:
+        return 0
+
+    cache_keys: Set[str] = set()
+    for tag in tags:
+        cache_keys |= get_tagged_cache_keys(cache_instance, tag)
+    keys = [*cache_keys, *[_cache_tag_key(tag) for tag in tags]]
+    if hasattr(cache_instance.cache, "_write_client"):
+        cache_instance.delete_many(*keys)
+    else:
+        # the generic `delete_many` stops at the first key that's already gone
+        for key in keys:
+            cache_instance.delete(key)
+    if cache_instance is cache_manager.data_cache and local_data_cache.enabled:
+        local_data_cache.invalidate(cache_keys)
+    stats_logger.gauge("invalidated_cache_tags", len(cache_keys))
+    logger.info("Invalidated %s cache keys for tags %s", len(cache_keys), tags)
+    return len(cache_keys)
 
 
 # If a user sets `max_age` to 0, for long the browser should cache the
@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+
+class CompiledQueryCache:
+    """
+    Process-local LRU cache of the SQL generated for chart queries.
+
+    Building the SQLAlchemy select, compiling it and reformatting it with
+    ``sqlparse`` is pure CPU work that only depends on the query object and on the
+    definition of the dataset, so its output is kept in memory, keyed by a
+    fingerprint of both, and reused by subsequent cache misses of the chart data
+    cache. The cache holds at most ``COMPILED_QUERY_CACHE_SIZE`` queries and is
+    disabled when the size is 0. Each entry remembers how long it took to build, so
+    that the time saved by hits can be reported.
+    """
+
+    def __init__(self) -> None:
+        self._queries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = 0
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+        self.stats: Dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "time_saved": 0.0,
+        }
+
+    def init_app(self, app: Flask) -> None:
+        self._max_size = app.config["COMPILED_QUERY_CACHE_SIZE"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached query for a fingerprint, if any.
+
+        :param key: The fingerprint of the query
+        :returns: The cached query, or ``None`` on a miss
+        """
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None:
+                self._incr("misses")
+                return None
+            self._queries.move_to_end(key)
+            self._incr("hits")
+        value, duration = entry
+        self.stats["time_saved"] += duration
+        self._stats_logger.timing("compiled_query_cache.time_saved", duration * 1000)
+        return value
+
+    def set(self, key: str, value: Any, duration: float) -> None:
+        """
+        Cache a query, evicting the least recently used ones beyond the max size.
+
+        :param key: The fingerprint of the query
+        :param value: The query
+        :param duration: How long it took to build the query, in seconds
+        """
+        with self._lock:
+            self._queries[key] = (value, duration)
+            self._queries.move_to_end(key)
+            while len(self._queries) > self._max_size:
+                self._queries.popitem(last=False)
+                self._incr("evictions")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queries.clear()
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "size": len(self._queries),
+                "max_size": self._max_size,
+            }
+
+    def _incr(self, key: str) -> None:
+        self.stats[key] += 1
+        self._stats_logger.incr(f"compiled_query_cache.{key}")
@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+""" Helpers to run queries concurrently, within the context of the current request.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from flask import (
+    _request_ctx_stack,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+
+T = TypeVar("T")
+
+_database_semaphores: Dict[int, threading.BoundedSemaphore] = {}
+_database_semaphores_lock = threading.Lock()
+
+
+@contextmanager
+def database_slot(database_id: Optional[int]) -> Iterator[None]:
+    """
+    Wait until the number of queries running on a database in this process is under
+    ``DATABASE_MAX_CONCURRENT_QUERIES``, and hold a slot while the query runs.
+
+    :param database_id: The database the query runs on
+    """
+    limit = current_app.config["DATABASE_MAX_CONCURRENT_QUERIES"]
+    if not limit or database_id is None:
+        yield
+        return
+
+    with _database_semaphores_lock:
+        semaphore = _database_semaphores.setdefault(
+            database_id, threading.BoundedSemaphore(limit)
+        )
+    with semaphore:
+        yield
+
+
+def copy_current_context(func: Callable[[], T]) -> Callable[[], T]:
+    """
+    Wrap a function so that it runs within a copy of the current app context,
+    including ``g`` (eg, the logged in user), and of the current request context,
+    if any, when it's called from another thread.
+
+    The metadata database session is scoped to the thread, so the function should
+    not lazy load attributes of the objects of the calling thread.
+    """
+    if not has_app_context():
+        return func
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_vars: Dict[str, Any] = dict(vars(g))
+    request_ctx = _request_ctx_stack.top.copy() if has_request_context() else None
+
+    def wrapper() -> T:
+        with app.app_context():
+            vars(g).update(g_vars)
+            if request_ctx is None:
+                return func()
+            with request_ctx:
+                return func()
+
+    return wrapper
+
+
+def run_concurrently(funcs: Sequence[Callable[[], T]], max_workers: int) -> List[T]:
+    """
+    Run functions in a pool of up to ``max_workers`` threads, each within a copy of
+    the current context, and return their results in order.
+
+    All the functions are run even if some of them fail, the exception of the
+    first one that failed is then raised.
+
+    :param funcs: The functions to run
+    :param max_workers: The maximum number of threads, the functions are run one
+        after the other in the current thread if it's 1
+    :returns: The results of the functions
+    """
+    if max_workers <= 1 or len(funcs) <= 1:
+        return [func() for func in funcs]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(funcs)),
+        thread_name_prefix="superset-query",
+    ) as executor:
+        futures = [executor.submit(copy_current_context(func)) for func in funcs]
+    return [future.result() for future in futures]
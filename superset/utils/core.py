@@ -1126,6 +1126,50 @@ def merge_extra_form_data(form_data: Dict[str, Any]) -> None:
                 )
 
 
+def merge_extra_form_data_into_query(
+    query: Dict[str, Any], extra_form_data: Dict[str, Any]
+) -> None:
+    """
+    Merge extra form data (appends and overrides), eg the state of the native
+    filters of a dashboard, into a query object of a saved query context.
+
+    :param query: The query object payload, which is mutated
+    :param extra_form_data: The extra form data applying to the chart
+    """
+    adhoc_form_data: Dict[str, Any] = {
+        "adhoc_filters": extra_form_data.get("adhoc_filters") or []
+    }
+    split_adhoc_filters_into_base_filters(adhoc_form_data)
+    append_filters = (extra_form_data.get("filters") or []) + adhoc_form_data["filters"]
+    if append_filters:
+        query["filters"] = (query.get("filters") or []) + append_filters
+
+    extras = query.get("extras") or {}
+    for clause in ("where", "having"):
+        if adhoc_form_data[clause]:
+            extras[clause] = " AND ".join(
+                f"({sql})"
+                for sql in (extras.get(clause), adhoc_form_data[clause])
+                if sql
+            )
+
+    for src_key, target_key in EXTRA_FORM_DATA_OVERRIDE_REGULAR_MAPPINGS.items():
+        value = extra_form_data.get(src_key)
+        if value is None:
+            continue
+        if target_key in ("granularity", "time_range"):
+            query[target_key] = value
+        elif target_key == "time_grain_sqla":
+            extras[target_key] = value
+
+    for key in EXTRA_FORM_DATA_OVERRIDE_EXTRA_KEYS:
+        value = extra_form_data.get(key)
+        if value is not None:
+            extras[key] = value
+    if extras:
+        query["extras"] = extras
+
+
 def merge_extra_filters(form_data: Dict[str, Any]) -> None:
     # extra_filters are temporary/contextual filters (using the legacy constructs)
     # that are external to the slice definition. We use those for dynamic
@@ -1904,3 +1948,44 @@ def create_zip(files: Dict[str, Any]) -> BytesIO:
                 fp.write(contents)
     buf.seek(0)
     return buf
+
+
+class _ChunkWriter:
+    """
+    A write-only, unseekable file that keeps what is written until it's drained.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(files: Iterable[Tuple[str, Iterable[bytes]]]) -> Iterator[bytes]:
+    """
+    Build a zip file from the chunks of its files, yielding the archive as it's
+    written, so that neither the files nor the archive are held in memory.
+
+    :param files: Pairs of file name and chunks of the file contents
+    :returns: The chunks of the zip file
+    """
+    writer = _ChunkWriter()
+    with ZipFile(writer, "w") as bundle:  # type: ignore
+        for filename, chunks in files:
+            with bundle.open(filename, "w") as fp:
+                for chunk in chunks:
+                    fp.write(chunk)
+                    data = writer.drain()
+                    if data:
+                        yield data
+    yield writer.drain()
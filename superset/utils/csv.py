@@ -16,7 +16,7 @@
 # under the License.
 import re
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 from urllib.error import URLError
 
 import numpy as np
@@ -66,14 +66,40 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
+    for col_idx, (_, column) in enumerate(df.items()):
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
+            for row_idx, value in enumerate(column.values):
                 if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+                    df.iat[row_idx, col_idx] = escape_value(value)
     return df.to_csv(**kwargs)
 
 
+def dfs_to_escaped_csv(dfs: Iterable[pd.DataFrame], **kwargs: Any) -> Iterator[str]:
+    """
+    Convert dataframes with the same columns to a single escaped CSV, one chunk
+    per dataframe, so that the whole file doesn't need to be built in memory.
+
+    Only the first chunk has a header.
+    """
+    header = kwargs.pop("header", True)
+    for df in dfs:
+        yield df_to_escaped_csv(df, header=header, **kwargs)
+        header = False
+
+
+def split_df(
+    df: pd.DataFrame, chunk_size: int, limit: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Split a dataframe in chunks of up to ``chunk_size`` rows, keeping at most
+    ``limit`` rows. The first chunk is yielded even if the dataframe is empty.
+    """
+    num_rows = len(df.index) if limit is None else min(len(df.index), limit)
+    yield df.iloc[: min(chunk_size, num_rows)]
+    for start in range(chunk_size, num_rows, chunk_size):
+        yield df.iloc[start : min(start + chunk_size, num_rows)]
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[Dict[str, str]] = None
 ) -> Optional[bytes]:
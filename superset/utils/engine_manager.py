@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import os
+import threading
+from collections import OrderedDict
+from timeit import default_timer
+from typing import Any, Dict, List, Tuple, Type
+
+from flask import Flask
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+from superset.utils.hashing import md5_sha_from_dict
+
+logger = logging.getLogger(__name__)
+
+EngineKey = Tuple[int, str]
+
+
+class EngineManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Process-wide registry of pooled SQLAlchemy engines for analytics databases.
+
+    Engines are keyed by the database id and a hash of the final URL and engine
+    parameters, i.e. after the schema, the effective user, the impersonation config
+    and ``DB_CONNECTION_MUTATOR`` have been applied, so that connections are never
+    shared between different connection settings. The registry is bounded: the
+    least recently used engine is disposed when ``ENGINE_POOL_MAX_ENGINES`` is
+    exceeded, and engines idle for longer than ``ENGINE_POOL_IDLE_TIMEOUT`` are
+    disposed on the next lookup.
+    """
+
+    def __init__(self) -> None:
+        self._engines: "OrderedDict[EngineKey, Engine]" = OrderedDict()
+        self._last_used: Dict[EngineKey, float] = {}
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._enabled = False
+        self._max_engines = 0
+        self._idle_timeout = 0
+        self._pool_params: Dict[str, Any] = {}
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+        self._pool_class = self._build_pool_class()
+        self.stats: Dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "checkouts": 0,
+            "connects": 0,
+            "checkout_wait": 0.0,
+        }
+
+    def init_app(self, app: Flask) -> None:
+        self._enabled = app.config["ENGINE_POOL_ENABLED"]
+        self._max_engines = app.config["ENGINE_POOL_MAX_ENGINES"]
+        self._idle_timeout = app.config["ENGINE_POOL_IDLE_TIMEOUT"]
+        self._pool_params = app.config["ENGINE_POOL_PARAMS"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def _build_pool_class(self) -> Type[QueuePool]:
+        manager = self
+
+        class TimedQueuePool(QueuePool):
+            """A ``QueuePool`` that reports how long checkouts wait for a connection"""
+
+            def _do_get(self) -> Any:
+                start = default_timer()
+                try:
+                    return super()._do_get()
+                finally:
+                    manager.record_checkout_wait(default_timer() - start)
+
+        return TimedQueuePool
+
+    @staticmethod
+    def get_key(database_id: int, url: URL, params: Dict[str, Any]) -> EngineKey:
+        return (
+            database_id,
+            md5_sha_from_dict({"url": str(url), "params": params}, default=str),
+        )
+
+    def get_engine(self, database_id: int, url: URL, params: Dict[str, Any]) -> Engine:
+        """
+        Return a pooled engine for the given connection settings, creating it if
+        needed.
+
+        :param database_id: The id of the ``Database`` the engine connects to
+        :param url: The final SQLAlchemy URL
+        :param params: The engine parameters, as passed to ``create_engine``
+        :returns: A pooled engine
+        """
+        key = self.get_key(database_id, url, params)
+        with self._lock:
+            self._reset_after_fork()
+            self._evict_idle()
+            now = default_timer()
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self._last_used[key] = now
+                self._incr("hits")
+                return engine
+
+            self._incr("misses")
+            engine = create_engine(
+                url, **{**self._pool_params, **params, "poolclass": self._pool_class}
+            )
+            self._add_pool_listeners(engine)
+            self._engines[key] = engine
+            self._last_used[key] = now
+            while len(self._engines) > self._max_engines:
+                self._dispose(next(iter(self._engines)))
+                self._incr("evictions")
+            return engine
+
+    def invalidate(self, database_id: int) -> None:
+        """
+        Dispose all the engines of a database, eg, when it has been edited.
+
+        :param database_id: The id of the ``Database``
+        """
+        with self._lock:
+            for key in [key for key in self._engines if key[0] == database_id]:
+                self._dispose(key)
+                self._incr("invalidations")
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._engines):
+                self._dispose(key)
+
+    def get_pool_status(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {"database_id": key[0], "status": engine.pool.status()}
+                for key, engine in self._engines.items()
+            ]
+
+    def record_checkout_wait(self, wait: float) -> None:
+        self.stats["checkout_wait"] += wait
+        self._stats_logger.timing("engine_pool.checkout_wait", wait * 1000)
+
+    def _add_pool_listeners(self, engine: Engine) -> None:
+        event.listen(engine, "checkout", lambda *args: self._incr("checkouts"))
+        event.listen(engine, "connect", lambda *args: self._incr("connects"))
+
+    def _evict_idle(self) -> None:
+        now = default_timer()
+        for key in [
+            key
+            for key, last_used in self._last_used.items()
+            if now - last_used > self._idle_timeout
+        ]:
+            self._dispose(key)
+            self._incr("evictions")
+
+    def _dispose(self, key: EngineKey) -> None:
+        engine = self._engines.pop(key)
+        self._last_used.pop(key, None)
+        try:
+            engine.dispose()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to dispose engine", exc_info=True)
+
+    def _reset_after_fork(self) -> None:
+        # connections must never be shared between processes, so engines created
+        # before a fork (eg, by a preloaded app) are dropped without disposing
+        # them, which would close the parent's connections
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._engines.clear()
+            self._last_used.clear()
+
+    def _incr(self, key: str) -> None:
+        self.stats[key] += 1
+        self._stats_logger.incr(f"engine_pool.{key}")
@@ -0,0 +1,243 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from flask import Flask
+from flask_caching import Cache
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+logger = logging.getLogger(__name__)
+
+
+def get_value_size(value: Dict[str, Any]) -> int:
+    """
+    Estimate the memory used by a chart data cache value, in bytes, which is
+    dominated by its dataframe.
+    """
+    size = sys.getsizeof(value.get("query") or "")
+    df = value.get("df")
+    if isinstance(df, pd.DataFrame):
+        size += int(df.memory_usage(index=True, deep=True).sum())
+    return size
+
+
+class LocalDataCache:
+    """
+    Process-local LRU cache in front of the chart data cache (``CacheRegion.DATA``).
+
+    Loading a chart from the data cache means a round trip to the cache backend and
+    deserializing the dataframe, even when the same process served the same key
+    moments ago. The values loaded from, or written to, the data cache are also kept
+    in memory, with their dataframe deserialized, up to
+    ``DATA_CACHE_LOCAL_MAX_BYTES`` in total and for at most
+    ``DATA_CACHE_LOCAL_TIMEOUT`` seconds, and evicted least recently used first.
+
+    When the data cache is stored in Redis, the keys that are written or deleted by
+    a process are published on the ``DATA_CACHE_LOCAL_INVALIDATION_CHANNEL``
+    channel, so that the other processes drop their copy. Otherwise, a copy can be
+    out of date until it expires.
+    """
+
+    def __init__(self) -> None:
+        self._values: "OrderedDict[str, Tuple[Dict[str, Any], int, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._size = 0
+        self._max_size = 0
+        self._timeout = 0
+        self._channel = ""
+        self._cache: Optional[Cache] = None
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+        # identifies the messages published by this process
+        self._origin = uuid.uuid4().hex
+        # the process that listens to the invalidations, which is reset on fork
+        self._listener_pid: Optional[int] = None
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def init_app(self, app: Flask, cache: Cache) -> None:
+        self._max_size = app.config["DATA_CACHE_LOCAL_MAX_BYTES"]
+        self._timeout = app.config["DATA_CACHE_LOCAL_TIMEOUT"]
+        self._channel = app.config["DATA_CACHE_LOCAL_INVALIDATION_CHANNEL"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+        self._cache = cache
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._timeout > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached value of a key, if any, with a copy of its dataframe,
+        which the caller is free to modify.
+
+        :param key: The cache key
+        :returns: The cached value, or ``None`` on a miss
+        """
+        self._listen()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and entry[2] < time.monotonic():
+                self._pop(key)
+                self._incr("expirations")
+                entry = None
+            if entry is None:
+                self._incr("misses")
+                return None
+            self._values.move_to_end(key)
+            self._incr("hits")
+
+        value = entry[0]
+        df = value.get("df")
+        if isinstance(df, pd.DataFrame):
+            value = {**value, "df": df.copy()}
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Cache a value, evicting the least recently used ones beyond the max size.
+        Values bigger than the max size aren't cached.
+
+        :param key: The cache key
+        :param value: The value, with its dataframe deserialized, which must not be
+            modified afterwards
+        """
+        self._listen()
+        size = get_value_size(value)
+        with self._lock:
+            self._pop(key)
+            if size > self._max_size:
+                return
+            self._values[key] = (value, size, time.monotonic() + self._timeout)
+            self._size += size
+            while self._size > self._max_size:
+                self._pop(next(iter(self._values)))
+                self._incr("evictions")
+
+    def invalidate(self, keys: Iterable[str], publish: bool = True) -> None:
+        """
+        Drop the cached values of keys that were written or deleted, in this process
+        and, unless ``publish`` is False, in the other processes.
+
+        :param keys: The cache keys
+        :param publish: Whether the other processes are notified
+        """
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                if self._pop(key):
+                    self._incr("invalidations")
+        if publish and keys:
+            self._publish(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "count": len(self._values),
+                "size": self._size,
+                "max_size": self._max_size,
+            }
+
+    def _pop(self, key: str) -> bool:
+        entry = self._values.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry[1]
+        return True
+
+    def _incr(self, key: str) -> None:
+        self.stats[key] += 1
+        self._stats_logger.incr(f"data_cache.local.{key}")
+
+    def _get_redis_client(self) -> Any:
+        # only the Redis backends have a client, which supports pub/sub
+        return (
+            getattr(self._cache.cache, "_write_client", None) if self._cache else None
+        )
+
+    def _publish(self, keys: List[str]) -> None:
+        client = self._get_redis_client()
+        if client is None:
+            return
+        try:
+            client.publish(
+                self._channel, json.dumps({"origin": self._origin, "keys": keys})
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Failed to publish the invalidated cache keys: %s", ex)
+
+    def _listen(self) -> None:
+        """
+        Start listening to the invalidations published by the other processes, in a
+        daemon thread of this process.
+        """
+        if self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            # the values that were cached before a fork aren't invalidated anymore
+            self._values.clear()
+            self._size = 0
+            self._origin = uuid.uuid4().hex
+            self._listener_pid = os.getpid()
+            client = self._get_redis_client()
+            if client is None:
+                return
+            threading.Thread(
+                target=self._receive_invalidations,
+                args=(client,),
+                name="superset-local-data-cache",
+                daemon=True,
+            ).start()
+
+    def _receive_invalidations(self, client: Any) -> None:
+        while True:
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                for message in pubsub.listen():
+                    payload = json.loads(message["data"])
+                    if payload["origin"] != self._origin:
+                        self.invalidate(payload["keys"], publish=False)
+            except Exception as ex:  # pylint: disable=broad-except
+                # the values that were invalidated in the meantime are missed
+                logger.warning("Lost the cache invalidation channel: %s", ex)
+                self.clear()
+                time.sleep(1)
@@ -21,14 +21,23 @@ import logging
 import re
 from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Any, Callable, cast, Dict, List, Optional, Union
+from typing import Any, Callable, cast, Dict, Iterator, List, Optional, Union
 from urllib import parse
 
 import backoff
 import humanize
 import pandas as pd
 import simplejson as json
-from flask import abort, flash, g, redirect, render_template, request, Response
+from flask import (
+    abort,
+    flash,
+    g,
+    redirect,
+    render_template,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder import expose
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.decorators import (
@@ -2521,6 +2530,15 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
             }:
                 # remove extra row from `increased_limit`
                 limit -= 1
+            if config["CSV_STREAMING_ENABLED"]:
+                row_limit = config["CSV_STREAMING_ROW_LIMIT"]
+                dfs = query.database.iter_df(
+                    sql,
+                    query.schema,
+                    chunk_size=config["CSV_STREAMING_CHUNK_SIZE"],
+                    limit=row_limit if limit is None else min(limit, row_limit),
+                )
+                return self._stream_csv(query, dfs)
             df = query.database.get_df(sql, query.schema)[:limit]
 
         csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
@@ -2528,10 +2546,39 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         response = CsvResponse(
             csv_data, headers=generate_download_headers("csv", quoted_csv_name)
         )
+        self._log_csv_export(query, len(df.index))
+        return response
+
+    def _stream_csv(self, query: Query, dfs: Iterator[pd.DataFrame]) -> FlaskResponse:
+        """
+        Stream the query results as CSV, as the chunks are fetched from the cursor.
+        """
+        row_count = 0
+
+        def count_rows() -> Iterator[pd.DataFrame]:
+            nonlocal row_count
+            for df in dfs:
+                row_count += len(df.index)
+                yield df
+
+        def generate() -> Iterator[str]:
+            yield from csv.dfs_to_escaped_csv(
+                count_rows(), index=False, **config["CSV_EXPORT"]
+            )
+            self._log_csv_export(query, row_count)
+
+        quoted_csv_name = parse.quote(query.name)
+        return CsvResponse(
+            stream_with_context(generate()),
+            headers=generate_download_headers("csv", quoted_csv_name),
+        )
+
+    @staticmethod
+    def _log_csv_export(query: Query, row_count: int) -> None:
         event_info = {
             "event_type": "data_export",
-            "client_id": client_id,
-            "row_count": len(df.index),
+            "client_id": query.client_id,
+            "row_count": row_count,
             "database": query.database.name,
             "schema": query.schema,
             "sql": query.sql,
@@ -2541,7 +2588,6 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         logger.debug(
             "CSV exported: %s", event_rep, extra={"superset_event": event_info}
         )
-        return response
 
     @api
     @handle_api_exception
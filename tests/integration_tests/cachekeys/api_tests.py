@@ -17,6 +17,7 @@
 # isort:skip_file
 """Unit tests for Superset"""
 from typing import Dict, Any
+from unittest import mock
 
 from tests.integration_tests.test_app import app  # noqa
 
@@ -163,3 +164,28 @@ def test_invalidate_existing_caches(logged_in_admin):
         .datasource_uid
         == "X__table"
     )
+
+
+def test_invalidate_cache_tags(logged_in_admin):
+    from superset.utils.cache import set_and_log_cache
+
+    with mock.patch.dict(app.config, {"CACHE_INVALIDATION_INDEX_ENABLED": True}):
+        data_cache = cache_manager.data_cache
+        for key, uid, tag in (
+            ("k1", "3__table", "database__1"),
+            ("k2", "4__table", "chart__5"),
+            ("k3", "5__table", "database__2"),
+        ):
+            set_and_log_cache(data_cache, key, {"value": key}, 60, uid, [tag])
+
+        rv = invalidate(
+            {"datasource_uids": ["3__table"], "database_ids": [], "chart_ids": [5]}
+        )
+        assert rv.status_code == 201
+        assert data_cache.get("k1") is None
+        assert data_cache.get("k2") is None
+        assert data_cache.get("k3")["value"] == "k3"
+
+        rv = invalidate({"database_ids": [2]})
+        assert rv.status_code == 201
+        assert data_cache.get("k3") is None
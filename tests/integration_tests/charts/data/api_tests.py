@@ -276,6 +276,80 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_post_processed_result_type(self):
+        """
+        Chart data API: Test post-processed chart data, in JSON and CSV formats
+        """
+        self.query_context_payload["result_type"] = "post_processed"
+        self.query_context_payload["queries"][0]["row_limit"] = 5
+        self.query_context_payload["form_data"] = {
+            "viz_type": "pivot_table_v2",
+            "groupbyRows": ["name"],
+            "groupbyColumns": [],
+            "metrics": ["sum__num"],
+            "colTotals": True,
+        }
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        result = rv.json["result"][0]
+        # the names, and the total
+        assert result["rowcount"] == 6
+        assert result["colnames"] == [["sum__num"]]
+        assert list(result["data"]) == ["sum__num"]
+        data = result["data"]["sum__num"]
+        assert len(data) == 6
+        assert data["Total (Sum)"] == sum(
+            value for name, value in data.items() if name != "Total (Sum)"
+        )
+
+        self.query_context_payload["result_format"] = "csv"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/csv"
+        lines = rv.data.decode("utf-8").splitlines()
+        assert lines[0] == "sum__num"
+        assert [int(line) for line in lines[1:]] == list(data.values())
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "flask.current_app.config",
+        {"CSV_STREAMING_ENABLED": True, "CSV_STREAMING_CHUNK_SIZE": 10},
+    )
+    def test_with_streamed_csv_result_format(self):
+        """
+        Chart data API: Test chart data with streamed CSV result format
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["queries"][0]["row_limit"] = 25
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/csv"
+        assert rv.is_streamed
+        lines = rv.data.decode("utf-8").splitlines()
+        assert len(lines) == 26
+        assert lines[0] == "name;sum__num"
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "flask.current_app.config",
+        {"CSV_STREAMING_ENABLED": True, "CSV_STREAMING_CHUNK_SIZE": 10},
+    )
+    def test_with_streamed_multi_query_csv_result_format(self):
+        """
+        Chart data API: Test chart data with streamed multi-query CSV result format
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
+        assert zipfile.read("query_1.csv") == zipfile.read("query_2.csv")
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_csv_result_format_when_actor_not_permitted_for_csv__403(self):
         """
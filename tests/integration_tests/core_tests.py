@@ -757,6 +757,29 @@ class TestCore(SupersetTestCase):
         self.assertEqual(list(expected_data), list(data))
         self.logout()
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "superset.views.core.config",
+        {"CSV_STREAMING_ENABLED": True, "CSV_STREAMING_CHUNK_SIZE": 2},
+    )
+    def test_csv_endpoint_streamed(self):
+        self.login()
+        sql = """
+            SELECT name
+            FROM birth_names
+            ORDER BY name
+            LIMIT 5
+        """
+        client_id = "{}".format(random.getrandbits(64))[:10]
+        resp = self.run_sql(sql, client_id, raise_on_error=True)
+        names = [row["name"] for row in resp["data"]]
+
+        resp = self.client.get("/superset/csv/{}".format(client_id))
+        assert resp.is_streamed
+        data = csv.reader(io.StringIO(resp.data.decode("utf-8")))
+        self.assertEqual(list(data), [["name"]] + [[name] for name in names])
+        self.logout()
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_extra_table_metadata(self):
         self.login()
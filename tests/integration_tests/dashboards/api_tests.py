@@ -20,6 +20,7 @@ import json
 from io import BytesIO
 from time import sleep
 from typing import List, Optional
+from unittest import mock
 from unittest.mock import patch
 from zipfile import is_zipfile, ZipFile
 
@@ -331,6 +332,89 @@ class TestDashboardApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixi
         data = json.loads(response.data.decode("utf-8"))
         self.assertEqual(data["result"], [])
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_get_dashboard_charts_data(self):
+        """
+        Dashboard API: Test getting the data of the charts of a dashboard
+        """
+        self.login(username="admin")
+        chart = db.session.query(Slice).filter_by(slice_name="Genders").one()
+        dashboard = chart.dashboards[0]
+        chart.query_context = json.dumps(
+            {
+                "datasource": {"id": chart.table.id, "type": "table"},
+                "queries": [
+                    {
+                        "time_range": "1900-01-01T00:00:00 : 2000-01-01T00:00:00",
+                        "granularity": "ds",
+                        "filters": [],
+                        "extras": {"having": "", "where": ""},
+                        "columns": ["gender"],
+                        "metrics": ["sum__num"],
+                        "orderby": [["sum__num", False]],
+                        "row_limit": 50000,
+                    }
+                ],
+                "result_format": "json",
+                "result_type": "full",
+            }
+        )
+        uri = f"api/v1/dashboard/{dashboard.id}/charts/data"
+        try:
+            rv = self.client.post(uri, json={})
+            assert rv.status_code == 200
+            assert rv.mimetype == "application/x-ndjson"
+            lines = [json.loads(line) for line in rv.data.decode().splitlines()]
+            assert sorted(line["chart_id"] for line in lines) == sorted(
+                slc.id for slc in dashboard.slices
+            )
+            results = {line["chart_id"]: line for line in lines}
+            assert results[chart.id]["result"][0]["rowcount"] == 2
+            assert all("result" in line or "error" in line for line in lines)
+
+            # the native filters apply to the chart, and the unknown charts are
+            # reported as errors
+            bad_id = self.get_nonexistent_numeric_id(Slice)
+            rv = self.client.post(
+                uri,
+                json={
+                    "charts": [
+                        {
+                            "id": chart.id,
+                            "extra_form_data": {
+                                "filters": [
+                                    {"col": "gender", "op": "IN", "val": ["boy"]}
+                                ]
+                            },
+                        },
+                        {"id": bad_id},
+                    ],
+                },
+            )
+            assert rv.status_code == 200
+            lines = [json.loads(line) for line in rv.data.decode().splitlines()]
+            assert lines[0] == {
+                "chart_id": bad_id,
+                "error": "The chart is not part of the dashboard",
+            }
+            assert lines[1]["chart_id"] == chart.id
+            assert lines[1]["result"][0]["data"] == [
+                {"gender": "boy", "sum__num": mock.ANY}
+            ]
+        finally:
+            chart.query_context = None
+            db.session.commit()
+
+    def test_get_dashboard_charts_data_not_found(self):
+        """
+        Dashboard API: Test getting the data of the charts of a dashboard that does
+        not exist
+        """
+        self.login(username="admin")
+        bad_id = self.get_nonexistent_numeric_id(Dashboard)
+        rv = self.client.post(f"api/v1/dashboard/{bad_id}/charts/data", json={})
+        assert rv.status_code == 404
+
     def test_get_dashboard(self):
         """
         Dashboard API: Test get dashboard
@@ -18,11 +18,13 @@
 import copy
 import json
 import time
+from unittest.mock import patch
 
 import pytest
 
 import tests.integration_tests.test_app  # pylint: disable=unused-import
 from superset import db
+from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.dashboards.dao import DashboardDAO
 from superset.models.dashboard import Dashboard
 from tests.integration_tests.base_tests import SupersetTestCase
@@ -122,3 +124,36 @@ class TestDashboardDAO(SupersetTestCase):
         DashboardDAO.set_dash_metadata(dashboard, original_data)
         session.merge(dashboard)
         session.commit()
+
+    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
+    def test_get_datasets_for_dashboard_cached(self):
+        self.login(username="admin")
+        get_eager_sqlatable_datasources = SqlaTable.get_eager_sqlatable_datasources
+        with patch.object(
+            SqlaTable,
+            "get_eager_sqlatable_datasources",
+            wraps=get_eager_sqlatable_datasources,
+        ) as mock_get_eager_sqlatable_datasources:
+            datasets = DashboardDAO.get_datasets_for_dashboard("world_health")
+            assert DashboardDAO.get_datasets_for_dashboard("world_health") == datasets
+            assert mock_get_eager_sqlatable_datasources.call_count <= 1
+
+            # the payload of an edited dataset is reloaded
+            column = (
+                db.session.query(TableColumn)
+                .filter_by(
+                    table_id=datasets[0]["id"],
+                    column_name=datasets[0]["columns"][0]["column_name"],
+                )
+                .one()
+            )
+            verbose_name = column.verbose_name
+            column.verbose_name = "Edited"
+            db.session.commit()
+            mock_get_eager_sqlatable_datasources.reset_mock()
+            datasets = DashboardDAO.get_datasets_for_dashboard("world_health")
+            assert datasets[0]["columns"][0]["verbose_name"] == "Edited"
+            mock_get_eager_sqlatable_datasources.assert_called_once()
+
+            column.verbose_name = verbose_name
+            db.session.commit()
@@ -16,12 +16,15 @@
 # under the License.
 import re
 import time
+from datetime import datetime, timedelta
 from typing import Any, Dict
+from unittest import mock
 
 import pytest
+from freezegun import freeze_time
 from pandas import DateOffset
 
-from superset import db
+from superset import db, security_manager
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
@@ -29,6 +32,9 @@ from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import SqlMetric
 from superset.datasource.dao import DatasourceDAO
 from superset.extensions import cache_manager
+from superset.tasks.async_queries import refresh_chart_data_cache
+from superset.utils.cache import get_tagged_cache_keys
+from superset.utils.concurrency import run_concurrently
 from superset.utils.core import (
     AdhocMetricExpressionType,
     backend,
@@ -41,6 +47,7 @@ from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_data,
 )
 from tests.integration_tests.fixtures.query_context import get_query_context
+from tests.integration_tests.test_app import app
 
 
 def get_sql_text(payload: Dict[str, Any]) -> str:
@@ -684,3 +691,116 @@ class TestQueryContext(SupersetTestCase):
                     row["sum__num__3 years later"]
                     == df_3_years_later.loc[index]["sum__num"]
                 )
+
+
+@pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+def test_concurrent_query_objects(app_context):
+    """
+    Test that the queries of the query objects are run concurrently, and that the
+    results are the same as when they are run one after the other.
+    """
+    payload = get_query_context("birth_names")
+    payload["force"] = True
+    query = payload["queries"][0]
+    payload["queries"] = [
+        {**query, "metrics": ["sum__num"], "groupby": ["state"]},
+        {**query, "metrics": ["count"], "groupby": ["gender"]},
+        # identical queries are only run once
+        {**query, "metrics": ["count"], "groupby": ["gender"]},
+    ]
+
+    with mock.patch.dict(app.config, {"CHART_DATA_MAX_WORKERS": 1}):
+        query_context = ChartDataQueryContextSchema().load(payload)
+        expected = query_context.get_payload()["queries"]
+    assert all("timing" not in result for result in expected)
+
+    query_context = ChartDataQueryContextSchema().load(payload)
+    with mock.patch(
+        "superset.common.query_context_processor.run_concurrently",
+        wraps=run_concurrently,
+    ) as run_concurrently_mock:
+        results = query_context.get_payload()["queries"]
+    assert len(run_concurrently_mock.call_args[0][0]) == 2
+
+    assert results[0]["timing"]["concurrent_queries"] == 2
+    assert results[1]["timing"]["concurrent_queries"] == 2
+    assert "timing" not in results[2]
+    for result, expected_result in zip(results, expected):
+        assert result["status"] == QueryStatus.SUCCESS
+        assert result["data"] == expected_result["data"]
+        assert result["query"] == expected_result["query"]
+
+
+@pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+def test_stale_while_revalidate(app_context):
+    """
+    Test that cached results past their cache timeout are served while they are
+    refreshed in the background, for the charts that opt in.
+    """
+    payload = get_query_context("birth_names")
+    payload["form_data"] = {"cache_stale_timeout": 3600}
+    query_context = ChartDataQueryContextSchema().load({**payload, "force": True})
+    cache_timeout = query_context.get_payload()["queries"][0]["cache_timeout"]
+
+    delay_path = "superset.tasks.async_queries.refresh_chart_data_cache.delay"
+    with freeze_time(datetime.utcnow() + timedelta(seconds=cache_timeout + 60)):
+        with mock.patch(delay_path) as delay:
+            query_context = ChartDataQueryContextSchema().load(payload)
+            result = query_context.get_payload()["queries"][0]
+        assert result["is_cached"]
+        assert result["is_stale"]
+        assert result["status"] == QueryStatus.SUCCESS
+        delay.assert_called_once()
+        _, form_data, cache_keys = delay.call_args[0]
+        assert cache_keys == [result["cache_key"]]
+
+        # the refresh is only scheduled once
+        with mock.patch(delay_path) as delay:
+            query_context = ChartDataQueryContextSchema().load(payload)
+            assert query_context.get_payload()["queries"][0]["is_stale"]
+        delay.assert_not_called()
+
+    admin = security_manager.find_user("admin")
+    refresh_chart_data_cache(admin.id, form_data, cache_keys)
+
+    query_context = ChartDataQueryContextSchema().load(payload)
+    result = query_context.get_payload()["queries"][0]
+    assert result["is_cached"]
+    assert not result["is_stale"]
+
+    # charts that don't opt in are not served stale results
+    payload["form_data"] = {}
+    with freeze_time(datetime.utcnow() + timedelta(seconds=cache_timeout + 60)):
+        query_context = ChartDataQueryContextSchema().load(payload)
+        assert not query_context.get_payload()["queries"][0]["is_stale"]
+
+
+@pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+def test_invalidate_cache_on_dataset_change(app_context):
+    """
+    Test that the cached results of a dataset are purged when it is changed.
+    """
+    payload = get_query_context("birth_names")
+    payload["form_data"] = {"slice_id": 1}
+    with mock.patch.dict(app.config, {"CACHE_INVALIDATION_INDEX_ENABLED": True}):
+        query_context = ChartDataQueryContextSchema().load({**payload, "force": True})
+        cache_key = query_context.get_payload()["queries"][0]["cache_key"]
+        datasource = query_context.datasource
+        data_cache = cache_manager.data_cache
+        assert cache_key in get_tagged_cache_keys(data_cache, datasource.uid)
+        assert cache_key in get_tagged_cache_keys(data_cache, "chart__1")
+        assert cache_key in get_tagged_cache_keys(
+            data_cache, f"database__{datasource.database.id}"
+        )
+
+        # the cache key doesn't change with the dataset
+        assert query_context.query_cache_key(query_context.queries[0]) == cache_key
+        metric = datasource.metrics[0]
+        description = metric.description
+        metric.description = "purge"
+        db.session.commit()
+        assert data_cache.get(cache_key) is None
+        assert query_context.query_cache_key(query_context.queries[0]) == cache_key
+
+        metric.description = description
+        db.session.commit()
@@ -508,6 +508,52 @@ class TestDatabaseModel(SupersetTestCase):
         db.session.delete(database)
         db.session.commit()
 
+    @patch("superset.connectors.sqla.models.compiled_query_cache._max_size", 10)
+    def test_compiled_query_cache(self):
+        from superset.extensions import compiled_query_cache
+
+        query_obj = {
+            "granularity": None,
+            "from_dttm": None,
+            "to_dttm": None,
+            "groupby": ["user"],
+            "metrics": ["cnt"],
+            "is_timeseries": False,
+            "filter": [],
+            "extras": {},
+        }
+        database = Database(
+            database_name="compiled_query_db", sqlalchemy_uri="sqlite://"
+        )
+        table = SqlaTable(table_name="compiled_query_table", database=database)
+        TableColumn(column_name="user", type="VARCHAR(255)", table=table)
+        SqlMetric(metric_name="cnt", expression="COUNT(*)", table=table)
+        db.session.add(table)
+        db.session.commit()
+        compiled_query_cache.clear()
+        hits = compiled_query_cache.stats["hits"]
+
+        sql = table.get_query_str(query_obj)
+        assert table.get_query_str(query_obj) == sql
+        assert compiled_query_cache.stats["hits"] == hits + 1
+
+        # the cache is bypassed for unsaved changes, and invalidated once saved
+        table.metrics[0].expression = "COUNT(DISTINCT user)"
+        assert "COUNT(DISTINCT user)" in table.get_query_str(query_obj)
+        db.session.commit()
+        assert "COUNT(DISTINCT user)" in table.get_query_str(query_obj)
+        assert compiled_query_cache.stats["hits"] == hits + 1
+
+        # templated queries are never cached
+        query_obj["extras"] = {"where": "user = '{{ 'abc' }}'"}
+        table.get_query_str(query_obj)
+        table.get_query_str(query_obj)
+        assert compiled_query_cache.stats["hits"] == hits + 1
+
+        db.session.delete(table)
+        db.session.delete(database)
+        db.session.commit()
+
 
 @pytest.fixture
 def text_column_table():
@@ -797,3 +843,48 @@ def test__normalize_prequery_result_type(
         assert str(normalized) == str(result)
     else:
         assert normalized == result
+
+
+@pytest.mark.parametrize(
+    "allows_tuple_in,dimensions,result",
+    [
+        (False, ["foo"], "foo IN ('a', 'b') OR foo IS NULL"),
+        (True, ["foo"], "foo IN ('a', 'b') OR foo IS NULL"),
+        (
+            False,
+            ["foo", "bar"],
+            "foo = 'a' AND bar IN (1, 2) OR foo = 'b' AND bar = 3 "
+            "OR foo IS NULL AND bar = 4",
+        ),
+        (
+            True,
+            ["foo", "bar"],
+            "(foo, bar) IN (('a', 1), ('a', 2), ('b', 3)) OR foo IS NULL AND bar = 4",
+        ),
+    ],
+)
+def test__get_top_groups(
+    app_context: Flask,
+    mocker: MockFixture,
+    allows_tuple_in: bool,
+    dimensions: List[str],
+    result: str,
+) -> None:
+    table = SqlaTable(table_name="foobar", database=get_example_database())
+    mocker.patch.object(table.db_engine_spec, "allows_tuple_in", new=allows_tuple_in)
+    columns_by_name = {
+        "foo": TableColumn(column_name="foo", table=table, type="STRING"),
+        "bar": TableColumn(column_name="bar", table=table, type="INTEGER"),
+    }
+    df = pd.DataFrame({"foo": ["a", "a", "b", None], "bar": [1, 2, 3, 4]})
+    if dimensions == ["foo"]:
+        df = df.drop_duplicates("foo")
+
+    top_groups = table._get_top_groups(
+        df,
+        dimensions,
+        {dimension: sa.column(dimension) for dimension in dimensions},
+        columns_by_name,
+    )
+
+    assert str(top_groups.compile(compile_kwargs={"literal_binds": True})) == result
@@ -14,9 +14,16 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from io import BytesIO
+from zipfile import ZipFile
+
 import pytest
 
-from superset.utils.core import form_data_to_adhoc, simple_filter_to_adhoc
+from superset.utils.core import (
+    form_data_to_adhoc,
+    simple_filter_to_adhoc,
+    stream_zip,
+)
 
 
 def test_simple_filter_to_adhoc_generates_deterministic_values():
@@ -82,3 +89,20 @@ def test_form_data_to_adhoc_incorrect_clause_type():
 
     with pytest.raises(ValueError):
         form_data_to_adhoc(form_data, "foobar")
+
+
+def test_stream_zip():
+    files = [
+        ("a.csv", iter([b"a;b\n", b"1;2\n"])),
+        ("empty.csv", iter([])),
+        ("b.csv", iter([b"c\n"])),
+    ]
+    chunks = list(stream_zip(files))
+    assert all(chunks)
+
+    bundle = ZipFile(BytesIO(b"".join(chunks)))
+    assert bundle.testzip() is None
+    assert bundle.namelist() == ["a.csv", "empty.csv", "b.csv"]
+    assert bundle.read("a.csv") == b"a;b\n1;2\n"
+    assert bundle.read("empty.csv") == b""
+    assert bundle.read("b.csv") == b"c\n"
@@ -81,3 +81,27 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_dfs_to_escaped_csv():
+    df = pd.DataFrame(
+        {"a": ["=x", "y", "@z", "w", "v"], "b": [1, 2, 3, 4, 5]},
+        index=[10, 11, 12, 13, 14],
+    )
+
+    chunks = list(
+        csv.dfs_to_escaped_csv(csv.split_df(df, 2), encoding="utf8", index=False)
+    )
+    assert chunks == ["a,b\n'=x,1\ny,2\n", "'@z,3\nw,4\n", "v,5\n"]
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, encoding="utf8", index=False)
+    # the original dataframe is left untouched
+    assert df["a"].tolist() == ["=x", "y", "@z", "w", "v"]
+
+
+def test_split_df():
+    df = pd.DataFrame({"a": range(5)})
+
+    assert [len(chunk) for chunk in csv.split_df(df, 2)] == [2, 2, 1]
+    assert [len(chunk) for chunk in csv.split_df(df, 2, limit=3)] == [2, 1]
+    assert [len(chunk) for chunk in csv.split_df(df, 10, limit=3)] == [3]
+    assert [list(chunk.columns) for chunk in csv.split_df(df.iloc[:0], 2)] == [["a"]]
@@ -0,0 +1,276 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_encode_decode_df(
+    app_context: None, mocker: MockerFixture, compression: str
+) -> None:
+    """
+    Test that dataframes round-trip through the Arrow cache format.
+    """
+    from superset.common.utils.query_cache_manager import decode_df, encode_df
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {
+            "CHART_DATA_CACHE_DF_FORMAT": "arrow",
+            "CHART_DATA_CACHE_ARROW_COMPRESSION": compression,
+        },
+    )
+    df = pd.DataFrame(
+        {
+            "__timestamp": [datetime(2021, 1, 1), datetime(2021, 1, 2), None],
+            "name": ["a", None, "c"],
+            "count": pd.Series([1, None, 3], dtype=object),
+            "sum": [1.5, 2.5, None],
+            "price": [Decimal("1.1"), Decimal("2.2"), Decimal("3.3")],
+            "ds": [date(2021, 1, 1), date(2021, 1, 2), date(2021, 1, 3)],
+            "flag": [True, False, True],
+        }
+    )
+
+    value = encode_df({"df": df, "query": "SELECT 1"})
+    assert value["df_format"] == "arrow"
+    assert isinstance(value["df"], bytes)
+    assert value["query"] == "SELECT 1"
+
+    pd.testing.assert_frame_equal(decode_df(value), df)
+
+
+def test_encode_df_fallback(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that dataframes that can't be represented in Arrow are kept as is.
+    """
+    from superset.common.utils.query_cache_manager import decode_df, encode_df
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"CHART_DATA_CACHE_DF_FORMAT": "arrow"},
+    )
+    for df in [
+        pd.DataFrame({"a": [1, "b"]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([("a", "b")] * 2)),
+    ]:
+        value = encode_df({"df": df})
+        assert "df_format" not in value
+        assert decode_df(value) is df
+
+
+def test_encode_df_pickle(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that dataframes are kept as is with the default format.
+    """
+    from superset.common.utils.query_cache_manager import encode_df
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"CHART_DATA_CACHE_DF_FORMAT": "pickle"},
+    )
+    df = pd.DataFrame({"a": [1, 2]})
+    assert encode_df({"df": df})["df"] is df
+
+
+def test_single_flight(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that identical queries wait for the one that is running.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {
+            "CHART_DATA_SINGLE_FLIGHT_ENABLED": True,
+            "CHART_DATA_SINGLE_FLIGHT_TIMEOUT": 10,
+            "CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL": 0.01,
+        },
+    )
+    sleep = mocker.patch("superset.common.utils.query_cache_manager.time.sleep")
+
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader_cache:
+        assert leader_cache is None
+        assert cache.cache.has("key__single_flight")
+
+        # the leader caches the results while the other request waits
+        def set_value(_: float) -> None:
+            QueryCacheManager.set(
+                "key",
+                {"df": pd.DataFrame({"a": [1]}), "query": "SELECT 1"},
+                region=CacheRegion.DATA,
+            )
+            cache.delete("key__single_flight")
+
+        sleep.side_effect = set_value
+        with QueryCacheManager.single_flight("key", CacheRegion.DATA) as other_cache:
+            assert other_cache is not None
+            assert other_cache.is_loaded
+            assert other_cache.df["a"].tolist() == [1]
+
+    assert not cache.cache.has("key__single_flight")
+
+
+def test_single_flight_timeout(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the query is run if the results are not cached in time.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {
+            "CHART_DATA_SINGLE_FLIGHT_ENABLED": True,
+            "CHART_DATA_SINGLE_FLIGHT_TIMEOUT": 0,
+            "CHART_DATA_SINGLE_FLIGHT_POLL_INTERVAL": 0.01,
+        },
+    )
+
+    cache.add("key__single_flight", "other", timeout=60)
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as query_cache:
+        assert query_cache is None
+    # the lock of the other request is left alone
+    assert cache.get("key__single_flight") == "other"
+
+
+def test_is_stale(app_context: None) -> None:
+    """
+    Test that cached values are stale once they are older than the timeout.
+    """
+    from freezegun import freeze_time
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    with freeze_time("2022-01-01 00:10:00"):
+        query_cache = QueryCacheManager(
+            is_cached=True, cache_dttm="2022-01-01T00:00:00"
+        )
+        assert query_cache.is_stale(300)
+        assert not query_cache.is_stale(900)
+        assert not QueryCacheManager().is_stale(300)
+
+
+def test_claim_refresh(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the refresh of a stale value is only claimed once.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+
+    assert QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 60)
+    assert not QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 60)
+    QueryCacheManager.release_refresh("key", CacheRegion.DATA)
+    assert QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 60)
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_get_many(app_context: None, mocker: MockerFixture, native: bool) -> None:
+    """
+    Test that the values of several keys are loaded in a single round trip when the
+    cache backend supports it.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+    from superset.exceptions import CacheLoadError
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch(
+        "superset.common.utils.query_cache_manager.has_native_get_many",
+        return_value=native,
+    )
+    get = mocker.spy(cache, "get")
+    get_many = mocker.spy(cache, "get_many")
+    for key in ("a", "b"):
+        QueryCacheManager.set(
+            key,
+            {"df": pd.DataFrame({key: [1]}), "query": f"SELECT {key}"},
+            region=CacheRegion.DATA,
+        )
+
+    query_caches = QueryCacheManager.get_many(
+        ["a", "b", "a", None, "c"], CacheRegion.DATA
+    )
+    assert list(query_caches) == ["a", "b", "c"]
+    assert query_caches["a"].is_loaded
+    assert query_caches["b"].df.columns.tolist() == ["b"]
+    assert not query_caches["c"].is_loaded
+    assert get_many.call_count == (1 if native else 0)
+    assert get.call_count == (0 if native else 3)
+
+    with pytest.raises(CacheLoadError):
+        QueryCacheManager.get_many(["a", "c"], CacheRegion.DATA, force_cached=True)
+
+    # forced queries don't load the cache
+    query_caches = QueryCacheManager.get_many(["a"], CacheRegion.DATA, True)
+    assert not query_caches["a"].is_loaded
+
+
+def test_has_native_get_many(app_context: None) -> None:
+    """
+    Test that the backends loading several keys at once are detected.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import has_native_get_many
+
+    assert not has_native_get_many(
+        Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    )
+    assert has_native_get_many(Cache(current_app, config={"CACHE_TYPE": "RedisCache"}))
@@ -17,6 +17,7 @@
 # pylint: disable=unused-argument, import-outside-toplevel, protected-access
 
 from textwrap import dedent
+from unittest import mock
 
 import pytest
 from flask.ctx import AppContext
@@ -102,3 +103,12 @@ def test_cte_query_parsing(
 
     actual = BaseEngineSpec.get_cte_query(original)
     assert actual == expected
+
+
+def test_fetch_arrow(app_context: AppContext) -> None:
+    """
+    Test that results aren't fetched as Arrow by default.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    assert BaseEngineSpec.fetch_arrow(mock.MagicMock(), 10) is None
@@ -0,0 +1,45 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=unused-argument, import-outside-toplevel
+
+from unittest import mock
+
+import pyarrow as pa
+from flask.ctx import AppContext
+
+
+def test_fetch_arrow(app_context: AppContext) -> None:
+    """
+    Test that results are fetched as an Arrow table, truncated to the limit.
+    """
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mock.MagicMock()
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3]})
+
+    assert DuckDBEngineSpec.fetch_arrow(cursor).num_rows == 3
+    assert DuckDBEngineSpec.fetch_arrow(cursor, 2).to_pydict() == {"a": [1, 2]}
+
+
+def test_fetch_arrow_unsupported(app_context: AppContext) -> None:
+    """
+    Test that cursors without Arrow support fall back to ``fetch_data``.
+    """
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mock.MagicMock(spec=["description", "fetchall"])
+    assert DuckDBEngineSpec.fetch_arrow(cursor) is None
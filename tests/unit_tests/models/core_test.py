@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import pandas as pd
+
+
+def test_iter_df(app_context: None) -> None:
+    """
+    Test that query results are fetched in chunks.
+    """
+    from superset.models.core import Database
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    sql = """
+        CREATE TABLE t (a INTEGER, b TEXT);
+        INSERT INTO t VALUES (1, 'x'), (2, 'y'), (3, NULL), (4, 'z'), (5, 'w');
+        SELECT * FROM t ORDER BY a
+    """
+
+    dfs = list(database.iter_df(sql, chunk_size=2))
+    assert [len(df) for df in dfs] == [2, 2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(dfs, ignore_index=True), database.get_df(sql)
+    )
+
+    dfs = list(database.iter_df(sql, chunk_size=2, limit=3))
+    assert [df["a"].tolist() for df in dfs] == [[1, 2], [3]]
+
+
+def test_iter_df_empty(app_context: None) -> None:
+    """
+    Test that the columns are returned when the query returns no rows.
+    """
+    from superset.models.core import Database
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+
+    dfs = list(database.iter_df("SELECT 1 AS a, 2 AS a WHERE 1 = 0"))
+    assert len(dfs) == 1
+    assert dfs[0].empty
+    assert list(dfs[0].columns) == ["a", "a__1"]
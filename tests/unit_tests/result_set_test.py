@@ -65,3 +65,84 @@ def test_column_names_as_bytes(app_context: None) -> None:
 |  1 | 2016-01-27 | 392.444 | 396.843 | 391.782 | 394.972 |     394.972 | 47424400 |
     """.strip()
     )
+
+
+def test_stringify_offending_column_only(app_context: None) -> None:
+    """
+    Test that only the columns that can't be converted to Arrow are stringified.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, {"a": 1}, 1.5, "x"), (2, [1, 2], 2.5, "y")]
+    description = [
+        ("int", None, None, None, None, None, None),
+        ("nested", None, None, None, None, None, None),
+        ("float", None, None, None, None, None, None),
+        ("string", None, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.schema.types == [
+        pa.int64(),
+        pa.string(),
+        pa.float64(),
+        pa.string(),
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"int": 1, "nested": '{"a": 1}', "float": 1.5, "string": "x"},
+        {"int": 2, "nested": "[1, 2]", "float": 2.5, "string": "y"},
+    ]
+
+
+def test_arrow_types_from_description(app_context: None) -> None:
+    """
+    Test that the Arrow types are taken from the cursor description when known.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, "a", None), (None, "b", 1.0)]
+    description = [
+        ("int", 23, None, None, None, None, None),
+        ("string", 1043, None, None, None, None, None),
+        ("float", 701, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(data, description, PostgresEngineSpec)  # type: ignore
+
+    assert result_set.table.schema.types == [pa.int64(), pa.string(), pa.float64()]
+
+
+def test_arrow_table(app_context: None) -> None:
+    """
+    Test building a result set from columnar data.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    table = pa.table(
+        {
+            "name": ["a", "b"],
+            "name__1": [1, 2],
+            "tags": [["x"], ["y", "z"]],
+        }
+    )
+    description = [
+        ("name", None, None, None, None, None, None),
+        ("name", None, None, None, None, None, None),
+        ("tags", None, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.size == 2
+    assert result_set.table.column_names == ["name", "name__1", "tags"]
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"name": "a", "name__1": 1, "tags": '["x"]'},
+        {"name": "b", "name__1": 2, "tags": '["y", "z"]'},
+    ]
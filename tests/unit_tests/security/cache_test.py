@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from flask import Flask
+from pytest_mock import MockerFixture
+
+
+def test_memoize(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the security lookups are memoized per request and user.
+    """
+    from superset.security import cache as security_cache
+
+    user = mocker.MagicMock(id=1, is_anonymous=False, is_guest_user=False)
+    other_user = mocker.MagicMock(id=2, is_anonymous=False, is_guest_user=False)
+    load = mocker.MagicMock(return_value=["filter"])
+
+    assert security_cache.memoize("rls_filters", user, (1,), load) == ["filter"]
+    assert security_cache.memoize("rls_filters", user, (1,), load) == ["filter"]
+    assert load.call_count == 1
+
+    security_cache.memoize("rls_filters", user, (2,), load)
+    security_cache.memoize("rls_filters", other_user, (1,), load)
+    assert load.call_count == 3
+
+    security_cache.invalidate()
+    security_cache.memoize("rls_filters", user, (1,), load)
+    assert load.call_count == 4
+
+
+def test_memoize_guest_user(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the lookups of guest users, whose roles come from their token, are not
+    memoized.
+    """
+    from superset.security import cache as security_cache
+
+    guest_user = mocker.MagicMock(is_anonymous=False, is_guest_user=True)
+    load = mocker.MagicMock(return_value=True)
+
+    security_cache.memoize("can_access", guest_user, ("can_read", "Chart"), load)
+    security_cache.memoize("can_access", guest_user, ("can_read", "Chart"), load)
+    assert load.call_count == 2
+
+
+def test_memoize_across_requests(app: Flask, mocker: MockerFixture) -> None:
+    """
+    Test that the lookups are cached across requests when SECURITY_CACHE_TIMEOUT is
+    set, until they are invalidated.
+    """
+    from flask_caching import Cache
+
+    from superset.security import cache as security_cache
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(security_cache.cache_manager, "_cache", cache)
+    mocker.patch.dict(app.config, {"SECURITY_CACHE_TIMEOUT": 60})
+    user = mocker.MagicMock(id=1, is_anonymous=False, is_guest_user=False)
+    load = mocker.MagicMock(return_value=False)
+
+    for _ in range(2):
+        with app.app_context():
+            assert not security_cache.memoize("can_access", user, ("a", "b"), load)
+    assert load.call_count == 1
+
+    with app.app_context():
+        security_cache.invalidate()
+    with app.app_context():
+        security_cache.memoize("can_access", user, ("a", "b"), load)
+    assert load.call_count == 2
@@ -39,6 +39,7 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     database.apply_limit_to_sql.return_value = "SELECT 42 AS answer LIMIT 2"
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
@@ -61,6 +62,44 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_sql_statement_arrow(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` uses Arrow results when the driver has them.
+    """
+    import pyarrow as pa
+
+    from superset.models.sql_lab import LimitingFactor
+    from superset.sql_lab import execute_sql_statement
+
+    query = mocker.MagicMock()
+    query.limit = 2
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.apply_limit_to_sql.return_value = "SELECT answer FROM t LIMIT 3"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow.return_value = pa.table({"answer": [42, 43, 44]})
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")
+
+    execute_sql_statement(
+        "SELECT answer FROM t",
+        query,
+        session=mocker.MagicMock(),
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+    )
+
+    db_engine_spec.fetch_arrow.assert_called_with(cursor, 3)
+    db_engine_spec.fetch_data.assert_not_called()
+    table = SupersetResultSet.call_args[0][0]
+    assert table.to_pydict() == {"answer": [42, 43]}
+    assert query.limiting_factor != LimitingFactor.NOT_LIMITED
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
     app_context: None,
@@ -82,6 +121,7 @@ def test_execute_sql_statement_with_rls(
     )
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
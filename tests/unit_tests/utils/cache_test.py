@@ -50,3 +50,34 @@ def test_memoized_func(app_context: None, mocker: MockerFixture) -> None:
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_invalidate_cache_tags(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the cached values are purged through the index of their tags.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.utils.cache import (
+        get_tagged_cache_keys,
+        invalidate_cache_tags,
+        set_and_log_cache,
+    )
+
+    mocker.patch.dict(
+        "superset.utils.cache.config", {"CACHE_INVALIDATION_INDEX_ENABLED": True}
+    )
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+
+    set_and_log_cache(cache, "a", {"value": 1}, 60, "1__table", ["chart__1"])
+    set_and_log_cache(cache, "b", {"value": 2}, 60, "1__table", ["chart__2"])
+    set_and_log_cache(cache, "c", {"value": 3}, 60, "2__table", ["chart__3"])
+    assert get_tagged_cache_keys(cache, "1__table") == {"a", "b"}
+
+    assert invalidate_cache_tags(cache, ["chart__2"]) == 1
+    assert cache.get("a") and not cache.get("b") and cache.get("c")
+
+    assert invalidate_cache_tags(cache, ["1__table", "chart__3"]) == 3
+    assert not cache.get("a") and not cache.get("c")
+    assert get_tagged_cache_keys(cache, "1__table") == set()
@@ -0,0 +1,53 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument, protected-access
+
+from flask import current_app
+
+
+def test_compiled_query_cache(app_context: None) -> None:
+    """
+    Test that the least recently used queries are evicted.
+    """
+    from superset.utils.compiled_query_cache import CompiledQueryCache
+
+    compiled_query_cache = CompiledQueryCache()
+    compiled_query_cache.init_app(current_app)
+    assert not compiled_query_cache.enabled
+    compiled_query_cache._max_size = 2
+    assert compiled_query_cache.enabled
+
+    assert compiled_query_cache.get("a") is None
+    compiled_query_cache.set("a", "SELECT a", 0.5)
+    compiled_query_cache.set("b", "SELECT b", 0.25)
+    assert compiled_query_cache.get("a") == "SELECT a"
+    compiled_query_cache.set("c", "SELECT c", 0.25)
+    assert compiled_query_cache.get("b") is None
+    assert compiled_query_cache.get("a") == "SELECT a"
+    assert compiled_query_cache.get("c") == "SELECT c"
+
+    assert compiled_query_cache.get_info() == {
+        "hits": 3,
+        "misses": 2,
+        "evictions": 1,
+        "time_saved": 1.25,
+        "size": 2,
+        "max_size": 2,
+    }
+
+    compiled_query_cache.clear()
+    assert compiled_query_cache.get("a") is None
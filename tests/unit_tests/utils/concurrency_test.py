@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import threading
+import time
+from typing import List
+
+import pytest
+from flask import current_app, g
+from pytest_mock import MockerFixture
+
+
+def test_run_concurrently(app_context: None) -> None:
+    """
+    Test that functions run in threads, with the context, and in order.
+    """
+    from superset.utils.concurrency import run_concurrently
+
+    g.user = "admin"
+    barrier = threading.Barrier(3, timeout=5)
+
+    def make_func(i: int):  # type: ignore
+        def func() -> str:
+            # all the functions need to be running at once to get past the barrier
+            barrier.wait()
+            assert current_app.config["TESTING"]
+            return f"{g.user}-{i}-{threading.current_thread().name != 'MainThread'}"
+
+        return func
+
+    assert run_concurrently([make_func(i) for i in range(3)], max_workers=3) == [
+        "admin-0-True",
+        "admin-1-True",
+        "admin-2-True",
+    ]
+
+
+def test_run_concurrently_sequential(app_context: None) -> None:
+    """
+    Test that functions run in the current thread with a single worker.
+    """
+    from superset.utils.concurrency import run_concurrently
+
+    threads: List[str] = []
+    run_concurrently(
+        [lambda: threads.append(threading.current_thread().name)] * 2,
+        max_workers=1,
+    )
+    assert threads == ["MainThread", "MainThread"]
+
+
+def test_run_concurrently_error(app_context: None) -> None:
+    """
+    Test that all the functions run when one fails.
+    """
+    from superset.utils.concurrency import run_concurrently
+
+    done: List[int] = []
+
+    def fail() -> None:
+        raise ValueError("error")
+
+    def succeed() -> None:
+        time.sleep(0.1)
+        done.append(1)
+
+    with pytest.raises(ValueError):
+        run_concurrently([fail, succeed, succeed], max_workers=3)
+    assert done == [1, 1]
+
+
+def test_database_slot(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the number of concurrent queries on a database is capped.
+    """
+    from superset.utils.concurrency import database_slot, run_concurrently
+
+    mocker.patch.dict(current_app.config, {"DATABASE_MAX_CONCURRENT_QUERIES": 2})
+    mocker.patch("superset.utils.concurrency._database_semaphores", {})
+    lock = threading.Lock()
+    running: List[int] = [0]
+    peak: List[int] = [0]
+
+    def query() -> None:
+        with database_slot(1):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+    run_concurrently([query] * 6, max_workers=6)
+    assert peak[0] == 2
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument, protected-access
+
+from flask import current_app
+from pytest_mock import MockerFixture
+from sqlalchemy.engine.url import make_url
+
+
+def get_engine_manager(**config: int):  # type: ignore
+    from superset.utils.engine_manager import EngineManager
+
+    engine_manager = EngineManager()
+    engine_manager.init_app(current_app)
+    engine_manager._enabled = True
+    for key, value in config.items():
+        setattr(engine_manager, f"_{key}", value)
+    return engine_manager
+
+
+def test_get_engine_reuses_engines(app_context: None) -> None:
+    """
+    Test that engines are reused for the same connection settings.
+    """
+    engine_manager = get_engine_manager()
+    url = make_url("sqlite://")
+
+    engine = engine_manager.get_engine(1, url, {})
+    assert engine_manager.get_engine(1, url, {}) is engine
+    assert engine_manager.get_engine(1, url, {"connect_args": {"a": 1}}) is not engine
+    assert engine_manager.get_engine(2, url, {}) is not engine
+    assert engine_manager.stats["hits"] == 1
+    assert engine_manager.stats["misses"] == 3
+
+    with engine.connect() as connection:
+        assert connection.execute("SELECT 1").scalar() == 1
+    with engine.connect() as connection:
+        assert connection.execute("SELECT 1").scalar() == 1
+    assert engine_manager.stats["checkouts"] == 2
+    assert engine_manager.stats["connects"] == 1
+
+
+def test_get_engine_bounded(app_context: None) -> None:
+    """
+    Test that the least recently used engine is disposed.
+    """
+    engine_manager = get_engine_manager(max_engines=2)
+    url = make_url("sqlite://")
+
+    engine_1 = engine_manager.get_engine(1, url, {})
+    engine_manager.get_engine(2, url, {})
+    engine_manager.get_engine(1, url, {})
+    engine_manager.get_engine(3, url, {})
+
+    assert [key[0] for key in engine_manager._engines] == [1, 3]
+    assert engine_manager.get_engine(1, url, {}) is engine_1
+    assert engine_manager.stats["evictions"] == 1
+
+
+def test_get_engine_idle_timeout(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that idle engines are disposed.
+    """
+    timer = mocker.patch("superset.utils.engine_manager.default_timer")
+    engine_manager = get_engine_manager(idle_timeout=60)
+    url = make_url("sqlite://")
+
+    timer.return_value = 0
+    engine = engine_manager.get_engine(1, url, {})
+    timer.return_value = 30
+    assert engine_manager.get_engine(1, url, {}) is engine
+    timer.return_value = 100
+    assert engine_manager.get_engine(1, url, {}) is not engine
+    assert engine_manager.stats["evictions"] == 1
+
+
+def test_invalidate(app_context: None) -> None:
+    """
+    Test that all the engines of a database are disposed on invalidation.
+    """
+    engine_manager = get_engine_manager()
+    url = make_url("sqlite://")
+
+    engine_manager.get_engine(1, url, {})
+    engine_manager.get_engine(1, url, {"connect_args": {"a": 1}})
+    engine_manager.get_engine(2, url, {})
+    engine_manager.invalidate(1)
+
+    assert [key[0] for key in engine_manager._engines] == [2]
+    assert engine_manager.stats["invalidations"] == 2
+
+
+def test_get_sqla_engine_pooled(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that ``Database.get_sqla_engine`` uses the registry when it's enabled.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.models.core import Database
+
+    engine_manager = get_engine_manager()
+    mocker.patch("superset.models.core.engine_manager", engine_manager)
+    mocker.patch.object(SqliteEngineSpec, "allows_connection_pooling", True)
+
+    database = Database(id=1, database_name="db", sqlalchemy_uri="sqlite://")
+    engine = database.get_sqla_engine()
+    assert engine.pool.__class__.__name__ == "TimedQueuePool"
+    assert engine_manager.stats["misses"] == 1
+
+    # transient databases are never pooled
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    engine = database.get_sqla_engine()
+    assert engine.pool.__class__.__name__ == "NullPool"
+    assert engine_manager.stats["misses"] == 1
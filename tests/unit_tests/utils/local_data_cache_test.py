@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument, protected-access
+
+import json
+from typing import Any, Dict
+
+import pandas as pd
+from flask import current_app
+from flask_caching import Cache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+
+def make_value(name: str) -> Dict[str, Any]:
+    return {"df": pd.DataFrame({name: range(100)}), "query": f"SELECT {name}"}
+
+
+def test_local_data_cache(app_context: None) -> None:
+    """
+    Test that the values are evicted when the cache is full, and expire.
+    """
+    from superset.utils.local_data_cache import get_value_size, LocalDataCache
+
+    local_data_cache = LocalDataCache()
+    local_data_cache.init_app(
+        current_app, Cache(current_app, config={"CACHE_TYPE": "NullCache"})
+    )
+    assert not local_data_cache.enabled
+    size = get_value_size(make_value("a"))
+    local_data_cache._max_size = 2 * size
+    assert local_data_cache.enabled
+
+    with freeze_time("2022-01-01 00:00:00") as frozen_time:
+        assert local_data_cache.get("a") is None
+        local_data_cache.set("a", make_value("a"))
+        local_data_cache.set("b", make_value("b"))
+        value = local_data_cache.get("a")
+        assert value is not None and value["query"] == "SELECT a"
+        # the dataframe is a copy
+        value["df"]["a"] = 0
+        assert local_data_cache.get("a")["df"]["a"].sum() == 4950
+
+        local_data_cache.set("c", make_value("c"))
+        assert local_data_cache.get("b") is None
+        assert local_data_cache.get("c") is not None
+
+        # values bigger than the cache aren't cached
+        local_data_cache.set("d", {"df": pd.DataFrame({"d": range(1000)})})
+        assert local_data_cache.get("d") is None
+
+        frozen_time.tick(local_data_cache._timeout + 1)
+        assert local_data_cache.get("a") is None
+
+    assert local_data_cache.get_info() == {
+        "hits": 3,
+        "misses": 3,
+        "expirations": 1,
+        "evictions": 1,
+        "invalidations": 0,
+        "count": 1,
+        "size": size,
+        "max_size": 2 * size,
+    }
+
+
+def test_local_data_cache_invalidate(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the invalidated keys are published to, and received from, the other
+    processes.
+    """
+    from superset.utils.local_data_cache import get_value_size, LocalDataCache
+
+    local_data_cache = LocalDataCache()
+    local_data_cache.init_app(
+        current_app, Cache(current_app, config={"CACHE_TYPE": "NullCache"})
+    )
+    local_data_cache._max_size = 10 * get_value_size(make_value("a"))
+    client = mocker.MagicMock()
+    mocker.patch.object(local_data_cache, "_get_redis_client", return_value=client)
+    thread = mocker.patch("superset.utils.local_data_cache.threading.Thread")
+
+    local_data_cache.set("a", make_value("a"))
+    local_data_cache.set("b", make_value("b"))
+    thread.assert_called_once()
+    thread.return_value.start.assert_called_once()
+
+    local_data_cache.invalidate(["a"])
+    assert local_data_cache.get("a") is None
+    channel, message = client.publish.call_args[0]
+    assert channel == "superset_data_cache_invalidation"
+    assert json.loads(message) == {"origin": local_data_cache._origin, "keys": ["a"]}
+
+    # the messages of the other processes invalidate the keys
+    client.pubsub.return_value.listen.return_value = [
+        {"data": json.dumps({"origin": local_data_cache._origin, "keys": ["b"]})},
+        {"data": json.dumps({"origin": "other", "keys": ["c"]})},
+    ]
+    local_data_cache.set("c", make_value("c"))
+    sleep = mocker.patch(
+        "superset.utils.local_data_cache.time.sleep", side_effect=InterruptedError
+    )
+    try:
+        local_data_cache._receive_invalidations(client)
+    except InterruptedError:
+        pass
+    sleep.assert_called_once()
+    assert local_data_cache.get_info()["invalidations"] == 2